@@ -1,82 +1,159 @@
-import statistics
 from collections import Counter
 from datetime import date, timedelta
 
 import numpy as np
-import requests
 
-from .constans import AnalysisPeriod
+from .constans import AnalysisPeriod, NBP_FIRST_DATE
+from .data_sources import get_data_source
+from .engine import calculate_statistical_measures, column_histograms, count_sessions
+from .instrumentation import span, timed
+from .rolling import RollingStatistics
+from .series import JOIN_INNER, RateSeries, cross_rate_matrix, cross_rates
 
 
-def get_sessions_data(
-        currency: str, analysisPeriod: AnalysisPeriod
-) -> tuple[int, int, int]:
+def _get_rates_concurrently(ranges: list[tuple[str, date, date]]) -> list[RateSeries]:
     """
     Args:
-        currency (str): The currency code for which session data is to be retrieved.
-        analysisPeriod (AnalysisPeriod): The period for which the session data is to be analyzed.
+        ranges (list): Tuples of (currency, date_start, date_end) of any length, fetched at the same time.
 
     Returns:
-        tuple: A tuple containing three integers representing the number of growth sessions,
-            decline sessions, and unchanged sessions.
+        list: Rates series for every requested range, in the order of ranges.
+    """
+    for currency, date_start, date_end in ranges:
+        if date_start < NBP_FIRST_DATE:
+            raise ValueError("Invalid request parameters")
+
+    with span("data.fetch"):
+        fetched = get_data_source().fetch_rates(ranges)
+    if any(rates is None for rates in fetched):
+        raise ValueError("Invalid request parameters")
+    with span("compute.series"):
+        return [RateSeries.from_rates(rates) for rates in fetched]
 
+
+def _get_table_rates(date_start: date, date_end: date) -> dict[str, RateSeries]:
     """
+    Args:
+        date_start (date): First day of the range.
+        date_end (date): Last day of the range.
 
-    date_today = date.today()
+    Returns:
+        dict: Maps code of every currency in the NBP table to its rates series.
+    """
+    if date_start < NBP_FIRST_DATE:
+        raise ValueError("Invalid request parameters")
+
+    with span("data.fetch"):
+        all_rates = get_data_source().fetch_table_rates(date_start, date_end)
+    with span("compute.series"):
+        return {currency: RateSeries.from_rates(rates) for currency, rates in all_rates.items()}
+
+
+def _get_rates(currency: str, date_start: date, date_end: date) -> RateSeries:
+    """
+    Args:
+        currency (str): The currency code.
+        date_start (date): First day of the range.
+        date_end (date): Last day of the range.
+
+    Returns:
+        RateSeries: Rates of the currency in the range.
+    """
+    return _get_rates_concurrently([(currency, date_start, date_end)])[0]
+
+
+def _check_range(date_start: date, date_end: date) -> tuple[date, date]:
+    """
+    Args:
+        date_start (date): First day of the range.
+        date_end (date): Last day of the range.
+
+    Returns:
+        tuple: First and last day of the range, the last one never later than today.
+    """
+    date_end = min(date_end, date.today())
+    if date_start < NBP_FIRST_DATE or date_start > date_end:
+        raise ValueError("Invalid request parameters")
+    return date_start, date_end
 
+
+def _get_period_start(date_today: date, analysisPeriod: AnalysisPeriod) -> date:
+    """
+    Args:
+        date_today (date): Last day of the analysis period.
+        analysisPeriod (AnalysisPeriod): The analysis period.
+
+    Returns:
+        date: First day of the analysis period ending on date_today.
+    """
     match analysisPeriod:
         case AnalysisPeriod.WEEK:
-            date_start = date_today - timedelta(days=6)
+            return date_today - timedelta(days=6)
         case AnalysisPeriod.TWO_WEEKS:
-            date_start = date_today - timedelta(days=13)
+            return date_today - timedelta(days=13)
         case AnalysisPeriod.MONTH:
-            date_start = date_today - timedelta(days=29)
+            return date_today - timedelta(days=29)
         case AnalysisPeriod.QUARTER:
-            date_start = date_today - timedelta(days=89)
+            return date_today - timedelta(days=89)
         case AnalysisPeriod.HALF_YEAR:
-            date_start = date_today - timedelta(days=179)
+            return date_today - timedelta(days=179)
         case AnalysisPeriod.YEAR:
-            date_start = date_today - timedelta(days=364)
+            return date_today - timedelta(days=364)
         case _:
             raise ValueError(f"Error: not a time period")
 
-    url = f"http://api.nbp.pl/api/exchangerates/rates/a/" + currency + "/" + date_start.strftime("%Y-%m-%d")
-    url = url + "/" + date_today.strftime("%Y-%m-%d") + "/?format=json"
-    # print(url)
 
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-        else:
-            raise ValueError("Invalid request parameters")
-    except requests.RequestException as e:
-        print("Error:", e)
-
-    rising_sessions = 0
-    falling_sessions = 0
-    no_changes = 0
-    status_flag = -2
-    days = len(data['rates'])
-
-    for day in range(0, days-1):
-        if data['rates'][day+1]['mid'] > data['rates'][day]['mid']:
-            flag = 1
-        elif data['rates'][day+1]['mid'] < data['rates'][day]['mid']:
-            flag = -1
-        else:
-            flag = 0
-
-        if flag != status_flag:
-            status_flag = flag
-            if status_flag == -1:
-                falling_sessions += 1
-            elif status_flag == 1:
-                rising_sessions += 1
-            else:
-                no_changes += 1
-
-    return rising_sessions, falling_sessions, no_changes
+def get_sessions_data(
+        currency: str, analysisPeriod: AnalysisPeriod
+) -> tuple[int, int, int]:
+    """
+    Args:
+        currency (str): The currency code for which session data is to be retrieved.
+        analysisPeriod (AnalysisPeriod): The period for which the session data is to be analyzed.
+
+    Returns:
+        tuple: A tuple containing three integers representing the number of growth sessions,
+            decline sessions, and unchanged sessions.
+
+    """
+
+    date_today = date.today()
+    return get_sessions_data_for_range(currency, _get_period_start(date_today, analysisPeriod), date_today)
+
+
+def get_sessions_data_for_range(currency: str, date_start: date, date_end: date) -> tuple[int, int, int]:
+    """
+    Args:
+        currency (str): The currency code for which session data is to be retrieved.
+        date_start (date): First day of the range, not earlier than 2002-01-02.
+        date_end (date): Last day of the range, ranges reaching past today end today.
+
+    Returns:
+        tuple: A tuple containing three integers representing the number of growth sessions,
+            decline sessions, and unchanged sessions.
+    """
+    date_start, date_end = _check_range(date_start, date_end)
+
+    return count_sessions(_get_rates(currency, date_start, date_end).mids)
+
+
+def get_sessions_data_all_periods(currency: str) -> dict[AnalysisPeriod, tuple[int, int, int]]:
+    """
+    Downloads the year long series once and computes session data for every analysis period from it.
+
+    Args:
+        currency (str): The currency code for which session data is to be retrieved.
+
+    Returns:
+        dict: Maps every AnalysisPeriod to the tuple returned by get_sessions_data.
+    """
+    date_today = date.today()
+    rates = _get_rates(currency, _get_period_start(date_today, AnalysisPeriod.YEAR), date_today)
+
+    return {
+        period: count_sessions(rates.since(_get_period_start(date_today, period)).mids)
+        for period in AnalysisPeriod
+    }
 
 
 def get_statistical_measures(
@@ -93,50 +170,191 @@ def get_statistical_measures(
     """
 
     date_today = date.today()
+    return get_statistical_measures_for_range(currency, _get_period_start(date_today, analysisPeriod), date_today)
+
+
+def get_statistical_measures_for_range(
+        currency: str, date_start: date, date_end: date
+) -> tuple[float, float, float, float]:
+    """
+    Args:
+        currency (str): The currency code for which statistical measures are to be calculated.
+        date_start (date): First day of the range, not earlier than 2002-01-02.
+        date_end (date): Last day of the range, ranges reaching past today end today.
+
+    Returns:
+        tuple: Median, mode, standard deviation and coefficient of variation of the rates in the range.
+    """
+    date_start, date_end = _check_range(date_start, date_end)
+
+    return calculate_statistical_measures(_get_rates(currency, date_start, date_end).mids)
+
+
+def get_statistical_measures_all_periods(currency: str) -> dict[AnalysisPeriod, tuple[float, float, float, float]]:
+    """
+    Downloads the year long series once and computes statistical measures for every analysis period from it.
+
+    Args:
+        currency (str): The currency code for which statistical measures are to be calculated.
+
+    Returns:
+        dict: Maps every AnalysisPeriod to the tuple returned by get_statistical_measures.
+    """
+    date_today = date.today()
+    rates = _get_rates(currency, _get_period_start(date_today, AnalysisPeriod.YEAR), date_today)
+
+    return {
+        period: calculate_statistical_measures(rates.since(_get_period_start(date_today, period)).mids)
+        for period in AnalysisPeriod
+    }
+
+
+@timed("compute.rolling_statistical_measures")
+def _calculate_rolling_statistical_measures(
+        rates: RateSeries, analysisPeriod: AnalysisPeriod, start_date: date
+) -> list[tuple[str, float, float, float, float]]:
+    """
+    Args:
+        rates (RateSeries): Rates starting at least one analysis period before start_date.
+        analysisPeriod (AnalysisPeriod): Length of the sliding window.
+        start_date (date): First day for which the measures are returned.
+
+    Returns:
+        list: Tuples of (effective date, median, mode, standard deviation, coefficient of variation).
+    """
+    window_days = (start_date - _get_period_start(start_date, analysisPeriod)).days
+    # index of the first rate of the window ending on every day
+    window_starts = np.searchsorted(rates.dates, rates.dates - np.timedelta64(window_days, "D")).tolist()
+    first_returned = rates.index_of(start_date)
+    effective_dates = rates.date_strings()
+
+    window = RollingStatistics()
+    rolling_measures = []
+    first = 0
+    for index, mid in enumerate(rates.mids.tolist()):
+        window.push(mid)
+        while first < window_starts[index]:
+            window.pop()
+            first += 1
+        if index >= first_returned:
+            rolling_measures.append((str(effective_dates[index]), *window.measures()))
+
+    return rolling_measures
+
+
+def get_rolling_statistical_measures(
+        currency: str, analysisPeriod: AnalysisPeriod, start_date: date
+) -> list[tuple[str, float, float, float, float]]:
+    """
+    Args:
+        currency (str): The currency code for which statistical measures are to be calculated.
+        analysisPeriod (AnalysisPeriod): Length of the sliding window ending on every day.
+        start_date (date): First day for which the measures are returned.
+
+    Returns:
+        list: For every fixing since start_date a tuple of its effective date and the measures returned by
+            get_statistical_measures for the window ending on that day. Standard deviation and coefficient
+            of variation are NaN when the window has a single rate.
+    """
+    date_today = date.today()
+    rates = _get_rates(currency, _get_period_start(start_date, analysisPeriod), date_today)
+
+    return _calculate_rolling_statistical_measures(rates, analysisPeriod, start_date)
+
+
+def get_rolling_statistical_measures_all_periods(
+        currency: str, start_date: date
+) -> dict[AnalysisPeriod, list[tuple[str, float, float, float, float]]]:
+    """
+    Args:
+        currency (str): The currency code for which statistical measures are to be calculated.
+        start_date (date): First day for which the measures are returned.
+
+    Returns:
+        dict: Maps every AnalysisPeriod to the list returned by get_rolling_statistical_measures.
+    """
+    date_today = date.today()
+    rates = _get_rates(currency, _get_period_start(start_date, AnalysisPeriod.YEAR), date_today)
+
+    return {
+        period: _calculate_rolling_statistical_measures(
+            rates.since(_get_period_start(start_date, period)), period, start_date
+        )
+        for period in AnalysisPeriod
+    }
+
 
+def _get_distribution_end(start_date: date, analysisPeriod: AnalysisPeriod) -> date:
+    """
+    Args:
+        start_date (date): The start date for analyzing the changes.
+        analysisPeriod (AnalysisPeriod): MONTH or QUARTER.
+
+    Returns:
+        date: Last day of the analysis period, possibly in the future.
+    """
     match analysisPeriod:
-        case AnalysisPeriod.WEEK:
-            date_start = date_today - timedelta(days=6)
-        case AnalysisPeriod.TWO_WEEKS:
-            date_start = date_today - timedelta(days=13)
-        case AnalysisPeriod.MONTH:
-            date_start = date_today - timedelta(days=29)
         case AnalysisPeriod.QUARTER:
-            date_start = date_today - timedelta(days=89)
-        case AnalysisPeriod.HALF_YEAR:
-            date_start = date_today - timedelta(days=179)
-        case AnalysisPeriod.YEAR:
-            date_start = date_today - timedelta(days=364)
+            return start_date + timedelta(days=120)
+        case AnalysisPeriod.MONTH:
+            return start_date + timedelta(days=30)
         case _:
-            raise ValueError(f"Error: not a time period")
+            raise ValueError("Analysis period must be either 'QUARTER' or 'MONTH'")
 
-    url = f"http://api.nbp.pl/api/exchangerates/rates/a/" + currency + "/" + date_start.strftime("%Y-%m-%d")
-    url = url + "/" + date_today.strftime("%Y-%m-%d") + "/?format=json"
-    # print(url)
 
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-        else:
-            raise ValueError("Invalid request parameters")
-    except requests.RequestException as e:
-        print("Error:", e)
+def _get_distribution_range(start_date: date, analysisPeriod: AnalysisPeriod) -> tuple[date, date]:
+    """
+    Args:
+        start_date (date): The start date for analyzing the changes.
+        analysisPeriod (AnalysisPeriod): MONTH or QUARTER.
 
-    mid_values = [rate['mid'] for rate in data['rates']]
-    mid_values.sort()
+    Returns:
+        tuple: First and last day of the analysis period, never later than today.
+    """
+    date_today = date.today()
+    if start_date > date.today():
+        raise ValueError("Start date cannot be in the future")
 
-    median_value = statistics.median(mid_values)
-    mode = statistics.mode(mid_values)
-    standard_deviation = statistics.stdev(mid_values)
-    mean_value = statistics.mean(mid_values)
-    coefficient_of_variation = standard_deviation/mean_value
+    return start_date, min(_get_distribution_end(start_date, analysisPeriod), date_today)
 
-    return median_value, mode, standard_deviation, coefficient_of_variation
+
+HISTOGRAM_BINS = 14
+
+
+def _changes_histogram(pair_rates: RateSeries) -> tuple[list, list]:
+    """
+    Args:
+        pair_rates (RateSeries): Cross rates of the currency pair.
+
+    Returns:
+        tuple: Histogram values and bins boundaries of the daily changes of the cross rates.
+    """
+    hist, bins = np.histogram(np.diff(pair_rates.mids), bins=HISTOGRAM_BINS)
+    return hist, bins
+
+
+@timed("compute.changes_distribution")
+def _calculate_changes_distribution(
+        rates1: RateSeries, rates2: RateSeries, join: str = JOIN_INNER
+) -> tuple[list, list]:
+    """
+    Args:
+        rates1 (RateSeries): Rates of the first currency.
+        rates2 (RateSeries): Rates of the second currency.
+        join (str): How days missing in one of the series are handled, JOIN_INNER or JOIN_FFILL.
+
+    Returns:
+        tuple: Histogram values and bins boundaries of the daily changes of the currency pair.
+    """
+    pair_rates = cross_rates(rates1, rates2, join)
+    if len(pair_rates) == 0:
+        raise ValueError("Data inconsistency")
+
+    return _changes_histogram(pair_rates)
 
 
 def get_changes_distribution(
-        currency_1: str, currency_2: str, start_date: date, analysisPeriod: AnalysisPeriod
+        currency_1: str, currency_2: str, start_date: date, analysisPeriod: AnalysisPeriod, join: str = JOIN_INNER
 ) -> tuple[list, list]:
     """
     Args:
@@ -144,71 +362,191 @@ def get_changes_distribution(
         currency_2 (str): The currency code for the second currency.
         start_date (date): The start date for analyzing the monthly changes.
         analysisPeriod (AnalysisPeriod): The period for which the analysis of monthly changes is to be performed.
+        join (str): How days with a rate of only one currency are handled, JOIN_INNER skips them and
+            JOIN_FFILL uses the last known rate of the other currency.
 
     Returns:
         tuple: tuple that has two lists: first representing the histogram values for every bin, and second representing bins boundries.
     """
-    date_today = date.today()
-    if start_date > date.today():
-        raise ValueError("Start date cannot be in the future")
+    date_start, date_end = _get_distribution_range(start_date, analysisPeriod)
+    return get_changes_distribution_for_range(currency_1, currency_2, date_start, date_end, join)
 
-    dates = []
-    match analysisPeriod:
-        case AnalysisPeriod.QUARTER:
-            end_date = start_date + timedelta(days=90)
-            if end_date >= date_today:
-                end_date = date_today
-                dates.append((start_date, end_date))
-            else:
-                dates.append((start_date, end_date))
-                end_date = end_date + timedelta(days=30)
-                if end_date > date_today:
-                    end_date = date_today
-                dates.append((dates[-1][1] + timedelta(days=1), end_date))
-        case AnalysisPeriod.MONTH:
-            end_date = start_date + timedelta(days=30)
-            if end_date > date_today:
-                end_date = date_today
-            dates.append((start_date, end_date))
-        case _:
-            raise ValueError("Analysis period must be either 'QUARTER' or 'MONTH'")
 
-    dates_str = []
-    for element in dates:
-        dates_str.append(
-            (element[0].strftime("%Y-%m-%d"), element[1].strftime("%Y-%m-%d"))
-        )
+def get_changes_distribution_for_range(
+        currency_1: str, currency_2: str, date_start: date, date_end: date, join: str = JOIN_INNER
+) -> tuple[list, list]:
+    """
+    Args:
+        currency_1 (str): The currency code for the first currency.
+        currency_2 (str): The currency code for the second currency.
+        date_start (date): First day of the range, not earlier than 2002-01-02.
+        date_end (date): Last day of the range, ranges reaching past today end today.
+        join (str): JOIN_INNER or JOIN_FFILL, see get_changes_distribution.
+
+    Returns:
+        tuple: Histogram values for every bin and bins boundaries of the daily changes of the currency pair.
+    """
+    date_start, date_end = _check_range(date_start, date_end)
+    rates1, rates2 = _get_rates_concurrently([(currency_1, date_start, date_end), (currency_2, date_start, date_end)])
+
+    return _calculate_changes_distribution(rates1, rates2, join)
+
+
+def get_cross_rate_matrix(
+        currencies: list[str], date_start: date, date_end: date, join: str = JOIN_INNER
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Args:
+        currencies (list): Codes of N currencies, each of them is downloaded once.
+        date_start (date): First day of the range, not earlier than 2002-01-02.
+        date_end (date): Last day of the range, ranges reaching past today end today.
+        join (str): JOIN_INNER or JOIN_FFILL, see get_changes_distribution.
 
-    # api_data holds elements like (date, currency1_rate, currency2_rate)
-    api_data: list[date, float, float] = []
-    for date_str in dates_str:
-        url1 = f"http://api.nbp.pl/api/exchangerates/rates/A/{currency_1}/{date_str[0]}/{date_str[1]}"
-        url2 = f"http://api.nbp.pl/api/exchangerates/rates/A/{currency_2}/{date_str[0]}/{date_str[1]}"
-
-        try:
-            response1 = requests.get(url1)
-            response2 = requests.get(url2)
-            if response1.status_code == 200 and response2.status_code == 200:
-                data1 = response1.json()
-                data2 = response2.json()
-
-                for rate1, rate2 in zip(data1["rates"], data2["rates"]):
-                    if rate1["effectiveDate"] != rate2["effectiveDate"]:
-                        raise ValueError("Data inconsistency")
-                    api_data.append(
-                        (rate1["effectiveDate"], rate1["mid"], rate2["mid"])
-                    )
-            else:
-                raise ValueError("Invalid request parameters")
-        except requests.RequestException as e:
-            print("Error:", e)
-
-    currency_changes = []
-    last_pair_value = api_data[0][2] / api_data[0][1]
-    for element in api_data[1:]:
-        pair_value = element[2] / element[1]
-        currency_changes.append(pair_value - last_pair_value)
-        last_pair_value = pair_value
-
-    hist, bins = np.histogram(currency_changes, bins=14)
+    Returns:
+        tuple: datetime64[D] array of the days and float64 array of shape (days, N, N), where element
+            [day, i, j] is the value of currencies[j] in units of currencies[i].
+    """
+    date_start, date_end = _check_range(date_start, date_end)
+    all_rates = _get_rates_concurrently([(currency, date_start, date_end) for currency in currencies])
+
+    return cross_rate_matrix(all_rates, join)
+
+
+@timed("compute.changes_distribution_matrix")
+def _calculate_changes_distribution_matrix(
+        all_rates: list[RateSeries], shared_bins: bool, join: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Args:
+        all_rates (list): Rates series of N currencies.
+        shared_bins (bool): Use the same bins boundaries for all pairs.
+        join (str): JOIN_INNER or JOIN_FFILL, see get_changes_distribution.
+
+    Returns:
+        tuple: Histogram values of shape (N, N, bins) and bins boundaries of shape (N, N, bins + 1), where
+            [i, j] is the histogram of changes of the pair (all_rates[i], all_rates[j]). Histograms of
+            a currency with itself have no values and NaN boundaries.
+    """
+    currencies_count = len(all_rates)
+    matrix = cross_rate_matrix(all_rates, join)[1]
+    pairs = ~np.eye(currencies_count, dtype=bool)
+    pair_hist, pair_bins = column_histograms(np.diff(matrix, axis=0)[:, pairs], HISTOGRAM_BINS, shared_bins)
+
+    hist = np.zeros((currencies_count, currencies_count, HISTOGRAM_BINS), dtype=pair_hist.dtype)
+    bins = np.full((currencies_count, currencies_count, HISTOGRAM_BINS + 1), np.nan)
+    hist[pairs] = pair_hist
+    bins[pairs] = pair_bins
     return hist, bins
+
+
+def get_changes_distribution_matrix(
+        currencies: list[str] | None, start_date: date, analysisPeriod: AnalysisPeriod, shared_bins: bool = False,
+        join: str = JOIN_INNER
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """
+    Downloads every currency once and computes histograms of changes of all N x (N - 1) pairs at once.
+
+    Args:
+        currencies (list | None): Codes of N currencies, all currencies in the NBP table if None.
+        start_date (date): The start date for analyzing the changes.
+        analysisPeriod (AnalysisPeriod): MONTH or QUARTER.
+        shared_bins (bool): Use the same bins boundaries for all pairs, so histograms can be compared.
+        join (str): JOIN_INNER or JOIN_FFILL, see get_changes_distribution.
+
+    Returns:
+        tuple: Codes of the currencies and the histogram values and bins boundaries returned by
+            get_changes_distribution_matrix_for_range.
+    """
+    date_start, date_end = _get_distribution_range(start_date, analysisPeriod)
+    return get_changes_distribution_matrix_for_range(currencies, date_start, date_end, shared_bins, join)
+
+
+def get_changes_distribution_matrix_for_range(
+        currencies: list[str] | None, date_start: date, date_end: date, shared_bins: bool = False,
+        join: str = JOIN_INNER
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """
+    Args:
+        currencies (list | None): Codes of N currencies, all currencies in the NBP table if None.
+        date_start (date): First day of the range, not earlier than 2002-01-02.
+        date_end (date): Last day of the range, ranges reaching past today end today.
+        shared_bins (bool): Use the same bins boundaries for all pairs.
+        join (str): JOIN_INNER or JOIN_FFILL, see get_changes_distribution. With JOIN_INNER only days with
+            rates of all the currencies are used.
+
+    Returns:
+        tuple: Codes of the currencies, histogram values of shape (N, N, bins) and bins boundaries of shape
+            (N, N, bins + 1). Element [i, j] is the histogram of the pair (currencies[i], currencies[j]), like
+            get_changes_distribution returns it. Histograms of a currency with itself have no values and NaN
+            boundaries.
+    """
+    date_start, date_end = _check_range(date_start, date_end)
+    if currencies is None:
+        table_rates = _get_table_rates(date_start, date_end)
+        currencies = sorted(table_rates)
+        all_rates = [table_rates[currency] for currency in currencies]
+    else:
+        currencies = [currency.upper() for currency in currencies]
+        all_rates = _get_rates_concurrently([(currency, date_start, date_end) for currency in currencies])
+
+    return currencies, *_calculate_changes_distribution_matrix(all_rates, shared_bins, join)
+
+
+def get_sessions_data_all_currencies(analysisPeriod: AnalysisPeriod) -> dict[str, tuple[int, int, int]]:
+    """
+    Args:
+        analysisPeriod (AnalysisPeriod): The period for which the session data is to be analyzed.
+
+    Returns:
+        dict: Maps code of every currency in the NBP table to the tuple returned by get_sessions_data.
+    """
+    date_today = date.today()
+    all_rates = _get_table_rates(_get_period_start(date_today, analysisPeriod), date_today)
+
+    return {currency: count_sessions(rates.mids) for currency, rates in all_rates.items()}
+
+
+def get_statistical_measures_all_currencies(
+        analysisPeriod: AnalysisPeriod
+) -> dict[str, tuple[float, float, float, float]]:
+    """
+    Args:
+        analysisPeriod (AnalysisPeriod): The period for which statistical measures are to be calculated.
+
+    Returns:
+        dict: Maps code of every currency in the NBP table to the tuple returned by get_statistical_measures.
+    """
+    date_today = date.today()
+    all_rates = _get_table_rates(_get_period_start(date_today, analysisPeriod), date_today)
+
+    return {currency: calculate_statistical_measures(rates.mids) for currency, rates in all_rates.items()}
+
+
+def get_changes_distribution_all_currencies(
+        currency_1: str, start_date: date, analysisPeriod: AnalysisPeriod, join: str = JOIN_INNER
+) -> dict[str, tuple[list, list]]:
+    """
+    Args:
+        currency_1 (str): The currency code for the first currency of every pair.
+        start_date (date): The start date for analyzing the changes.
+        analysisPeriod (AnalysisPeriod): MONTH or QUARTER.
+        join (str): JOIN_INNER or JOIN_FFILL, see get_changes_distribution.
+
+    Returns:
+        dict: Maps code of every other currency in the NBP table to the tuple returned by get_changes_distribution
+            for the pair (currency_1, currency).
+    """
+    all_rates = _get_table_rates(*_get_distribution_range(start_date, analysisPeriod))
+    if currency_1.upper() not in all_rates:
+        raise ValueError("Invalid request parameters")
+
+    rates1 = all_rates[currency_1.upper()]
+    distributions = {}
+    for currency, rates in all_rates.items():
+        if currency == currency_1.upper():
+            continue
+        # currencies added to or removed from the table within the range are paired on their common days
+        pair_rates = cross_rates(rates1, rates, join)
+        if len(pair_rates) > 0:
+            distributions[currency] = _changes_histogram(pair_rates)
+    return distributions
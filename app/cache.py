@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+# rough size of one rate dict with its date string and float, used to keep the cache under its memory cap
+APPROX_RATE_BYTES = 300
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TODAY_TTL = 300.0
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of fetched rates with a memory cap. Entries covering only past days never expire,
+    because published rates do not change. Entries covering today expire after today_ttl seconds.
+    """
+
+    def __init__(
+            self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+            today_ttl: float = DEFAULT_TODAY_TTL, clock=time.monotonic
+    ):
+        """
+        Args:
+            max_entries (int): Maximal number of cached entries.
+            max_bytes (int): Maximal approximate memory used by cached rates.
+            today_ttl (float): Lifetime in seconds of entries covering today.
+            clock (callable): Returns current time in seconds.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.today_ttl = today_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            Cached value, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, date_end: date, size: int):
+        """
+        Args:
+            key: Key of the entry.
+            value: Cached value, not modified afterwards.
+            date_end (date): Last day covered by the value, decides whether the entry expires.
+            size (int): Approximate memory used by the value in bytes.
+        """
+        if size > self.max_bytes:
+            return
+        expires_at = self._clock() + self.today_ttl if date_end >= date.today() else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        self._size -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Numbers of hits, misses, evictions and entries, approximate size in bytes and hit rate.
+        """
+        with self._lock:
+            requests_count = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hit_rate': self.hits / requests_count if requests_count else 0.0,
+            }
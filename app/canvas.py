@@ -0,0 +1,103 @@
+import time
+from collections import deque
+
+import numpy as np
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from .instrumentation import span
+
+FRAME_HISTORY = 100
+# axes are rescaled when the bars leave them or take less than this part of them, with headroom added
+# around the bars so that the next similar histograms fit without a full redraw
+MIN_FILL = 0.5
+HEADROOM = 0.2
+
+
+class MplCanvas(FigureCanvas):
+    """
+    Histogram chart keeping its bars between updates. New data only moves and resizes the bars, which are
+    blitted over the cached background unless the axes have to be rescaled.
+    """
+
+    def __init__(self, hist=None, bins=None):
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot(111)
+        super().__init__(self.fig)
+        self.bars = []
+        self._background = None
+        self.frame_times = deque(maxlen=FRAME_HISTORY)
+        self.mpl_connect("draw_event", self._on_draw)
+        if hist is not None:
+            self.plot_data(hist, bins)
+
+    def plot_data(self, hist, bins):
+        """
+        Args:
+            hist (list): Histogram values.
+            bins (list): Bins boundaries, one more than values.
+        """
+        hist = np.asarray(hist, dtype=np.float64)
+        bins = np.asarray(bins, dtype=np.float64)
+        start = time.perf_counter()
+        with span("mpl.plot"):
+            if len(self.bars) != len(hist):
+                self._create_bars(len(hist))
+            for bar, left, width, height in zip(self.bars, bins[:-1], np.diff(bins), hist):
+                bar.set_x(left)
+                bar.set_width(width)
+                bar.set_height(height)
+            rescaled = self._rescale(bins[0], bins[-1], hist.max(initial=0.0))
+
+        if rescaled or self._background is None:
+            # the bars are drawn with the rest of the figure when Qt repaints the canvas
+            self.draw_idle()
+            return
+        with span("mpl.blit"):
+            self.restore_region(self._background)
+            self._draw_bars()
+            self.blit(self.fig.bbox)
+        self.frame_times.append(time.perf_counter() - start)
+
+    def _create_bars(self, count: int):
+        for bar in self.bars:
+            bar.remove()
+        self.bars = list(self.ax.bar(np.zeros(count), np.zeros(count), align='edge', edgecolor='black'))
+        for bar in self.bars:
+            # animated artists are left out of full draws and drawn over the cached background instead
+            bar.set_animated(True)
+        self._background = None
+
+    def _rescale(self, left: float, right: float, top: float) -> bool:
+        x_min, x_max = self.ax.get_xlim()
+        y_top = self.ax.get_ylim()[1]
+        x_fits = x_min <= left and right <= x_max and (right - left) >= MIN_FILL * (x_max - x_min)
+        y_fits = top <= y_top and top >= MIN_FILL * y_top
+        if x_fits and y_fits and self._background is not None:
+            return False
+
+        margin = (right - left) * HEADROOM
+        self.ax.set_xlim(left - margin, right + margin)
+        self.ax.set_ylim(0, top * (1 + HEADROOM) or 1)
+        return True
+
+    def _draw_bars(self):
+        for bar in self.bars:
+            self.ax.draw_artist(bar)
+
+    def draw(self):
+        start = time.perf_counter()
+        with span("mpl.draw"):
+            super().draw()
+        self.frame_times.append(time.perf_counter() - start)
+
+    def _on_draw(self, event):
+        self._background = self.copy_from_bbox(self.fig.bbox)
+        self._draw_bars()
+
+    def frame_time(self) -> float:
+        """
+        Returns:
+            float: Mean time in seconds of the latest repaints, full draws and blits, 0 before the first one.
+        """
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
@@ -0,0 +1,310 @@
+# You can run batch analyses without the GUI from the root directory of the project, for example
+# `python -m app.cli measures --currencies EUR USD --periods WEEK YEAR --format csv --output measures.csv`
+import argparse
+import csv
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from . import instrumentation
+from .api import (
+    get_changes_distribution, get_changes_distribution_for_range, get_sessions_data_all_periods,
+    get_sessions_data_for_range, get_statistical_measures_all_periods, get_statistical_measures_for_range
+)
+from .constans import AnalysisPeriod
+
+FORMATS = ("csv", "json", "parquet")
+DEFAULT_WORKERS = 4
+SESSIONS_COLUMNS = ["currency", "period", "growth_sessions", "downward_sessions", "unchanged_sessions"]
+MEASURES_COLUMNS = ["currency", "period", "median", "mode", "standard_deviation", "coefficient_of_variation"]
+DISTRIBUTION_PERIODS = (AnalysisPeriod.MONTH, AnalysisPeriod.QUARTER)
+DISTRIBUTION_COLUMNS = ["pair", "period", "start_date", "bin_start", "bin_end", "count"]
+
+
+def _run_tasks(fn, tasks: list[tuple[str, tuple]], workers: int) -> tuple[list, list[str]]:
+    """
+    Args:
+        fn (callable): Function returning rows for one set of arguments.
+        tasks (list): Tuples of (label, args), fn is called once with every args, the label names it in errors.
+        workers (int): Maximal number of calls running in parallel.
+
+    Returns:
+        tuple: Rows returned by all successful calls, in the order of tasks, and descriptions of failed calls.
+    """
+    rows = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(fn, *args) for _, args in tasks]
+        for (label, _), future in zip(tasks, futures):
+            try:
+                rows.extend(future.result())
+            except Exception as e:
+                errors.append(f"{label}: {e}")
+    return rows, errors
+
+
+def _range_name(date_start: date, date_end: date) -> str:
+    return f"{date_start.isoformat()}/{date_end.isoformat()}"
+
+
+def _currency_tasks(
+        currencies: list[str], periods: list[AnalysisPeriod], ranges: list[tuple[date, date]]
+) -> list[tuple[str, tuple]]:
+    # all periods of a currency come from one download, every range is a separate task
+    tasks = []
+    for currency in currencies:
+        currency = currency.upper()
+        if periods:
+            tasks.append((currency, (currency, periods, [])))
+        tasks.extend(
+            (f"{currency} {_range_name(*date_range)}", (currency, [], [date_range])) for date_range in ranges
+        )
+    return tasks
+
+
+def _sessions_rows(currency: str, periods: list[AnalysisPeriod], ranges: list[tuple[date, date]]) -> list[dict]:
+    rows = []
+    if periods:
+        sessions = get_sessions_data_all_periods(currency)
+        rows.extend(dict(zip(SESSIONS_COLUMNS, (currency, period.name, *sessions[period]))) for period in periods)
+    for date_start, date_end in ranges:
+        sessions = get_sessions_data_for_range(currency, date_start, date_end)
+        rows.append(dict(zip(SESSIONS_COLUMNS, (currency, _range_name(date_start, date_end), *sessions))))
+    return rows
+
+
+def _measures_rows(currency: str, periods: list[AnalysisPeriod], ranges: list[tuple[date, date]]) -> list[dict]:
+    rows = []
+    if periods:
+        measures = get_statistical_measures_all_periods(currency)
+        rows.extend(
+            dict(zip(MEASURES_COLUMNS, (currency, period.name, *(float(value) for value in measures[period]))))
+            for period in periods
+        )
+    for date_start, date_end in ranges:
+        measures = get_statistical_measures_for_range(currency, date_start, date_end)
+        rows.append(dict(zip(
+            MEASURES_COLUMNS, (currency, _range_name(date_start, date_end), *(float(value) for value in measures))
+        )))
+    return rows
+
+
+def _distribution_rows(
+        pair: tuple[str, str], start_date: date, period: AnalysisPeriod | None, date_end: date | None = None
+) -> list[dict]:
+    if period is None:
+        hist, bins = get_changes_distribution_for_range(pair[0], pair[1], start_date, date_end)
+        period_name = _range_name(start_date, date_end)
+    else:
+        hist, bins = get_changes_distribution(pair[0], pair[1], start_date, period)
+        period_name = period.name
+    return [
+        dict(zip(DISTRIBUTION_COLUMNS, (
+            f"{pair[0]}/{pair[1]}", period_name, start_date.isoformat(), float(bins[index]), float(bins[index + 1]),
+            int(count)
+        )))
+        for index, count in enumerate(hist)
+    ]
+
+
+def run_sessions(
+        currencies: list[str], periods: list[AnalysisPeriod], ranges: list[tuple[date, date]] = (),
+        workers: int = DEFAULT_WORKERS
+):
+    """
+    Args:
+        currencies (list): Currency codes to analyse.
+        periods (list): Analysis periods ending today reported for every currency.
+        ranges (list): Tuples of (date_start, date_end) of any length reported for every currency.
+        workers (int): Maximal number of currencies analysed in parallel.
+
+    Returns:
+        tuple: Rows with numbers of sessions for every currency and period or range, and descriptions of failed
+            currencies.
+    """
+    return _run_tasks(_sessions_rows, _currency_tasks(currencies, periods, ranges), workers)
+
+
+def run_measures(
+        currencies: list[str], periods: list[AnalysisPeriod], ranges: list[tuple[date, date]] = (),
+        workers: int = DEFAULT_WORKERS
+):
+    """
+    Args:
+        currencies (list): Currency codes to analyse.
+        periods (list): Analysis periods ending today reported for every currency.
+        ranges (list): Tuples of (date_start, date_end) of any length reported for every currency.
+        workers (int): Maximal number of currencies analysed in parallel.
+
+    Returns:
+        tuple: Rows with statistical measures for every currency and period or range, and descriptions of failed
+            currencies.
+    """
+    return _run_tasks(_measures_rows, _currency_tasks(currencies, periods, ranges), workers)
+
+
+def run_distribution(
+        pairs: list[tuple[str, str]], start_date: date | None, periods: list[AnalysisPeriod],
+        ranges: list[tuple[date, date]] = (), workers: int = DEFAULT_WORKERS
+):
+    """
+    Args:
+        pairs (list): Tuples of two currency codes.
+        start_date (date | None): The start date for analyzing the changes in periods, needed only with periods.
+        periods (list): MONTH and/or QUARTER.
+        ranges (list): Tuples of (date_start, date_end) of any length.
+        workers (int): Maximal number of pairs analysed in parallel.
+
+    Returns:
+        tuple: Rows with one histogram bin each for every pair and period or range, and descriptions of failed pairs.
+    """
+    tasks = [(f"{pair[0]}/{pair[1]} {period.name}", (pair, start_date, period)) for pair in pairs for period in periods]
+    tasks += [
+        (f"{pair[0]}/{pair[1]} {_range_name(date_start, date_end)}", (pair, date_start, None, date_end))
+        for pair in pairs for date_start, date_end in ranges
+    ]
+    return _run_tasks(_distribution_rows, tasks, workers)
+
+
+def write_rows(rows: list[dict], columns: list[str], output_format: str, output: str | None):
+    """
+    Args:
+        rows (list): Rows to write, dicts with keys from columns.
+        columns (list): Names of the columns in the order they are written.
+        output_format (str): One of FORMATS.
+        output (str | None): Path of the written file, standard output if not given. Required for parquet.
+    """
+    if output_format == "parquet":
+        # optional dependency, only needed for this format
+        import pyarrow
+        import pyarrow.parquet
+
+        table = pyarrow.table({column: [row[column] for row in rows] for column in columns})
+        pyarrow.parquet.write_table(table, output)
+        return
+
+    file = open(output, "w", newline="") if output else sys.stdout
+    try:
+        if output_format == "csv":
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, file, indent=2)
+            file.write("\n")
+    finally:
+        if output:
+            file.close()
+
+
+def _parse_period(value: str) -> AnalysisPeriod:
+    try:
+        return AnalysisPeriod[value.upper()]
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"invalid period: {value}")
+
+
+def _parse_distribution_period(value: str) -> AnalysisPeriod:
+    period = _parse_period(value)
+    if period not in DISTRIBUTION_PERIODS:
+        raise argparse.ArgumentTypeError(
+            f"invalid period: {value}, choose from {', '.join(period.name for period in DISTRIBUTION_PERIODS)}"
+        )
+    return period
+
+
+def _parse_pair(value: str) -> tuple[str, str]:
+    currencies = value.upper().replace("-", "/").split("/")
+    if len(currencies) != 2 or not all(currencies):
+        raise argparse.ArgumentTypeError(f"invalid currency pair: {value}")
+    return currencies[0], currencies[1]
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli", description="Batch analyses of NBP exchange rates without the GUI."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--format", choices=FORMATS, default="csv", help="output format, parquet requires pyarrow")
+    common.add_argument("--output", help="output file, standard output if not given")
+    common.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="analyses running in parallel")
+    common.add_argument("--diagnostics", metavar="FILE", help="record timings and write them to FILE as JSON")
+    common.add_argument(
+        "--range", nargs=2, type=_parse_date, action="append", default=[], dest="ranges",
+        metavar=("START", "END"), help="custom date range of any length since 2002-01-02, can be repeated"
+    )
+
+    for command, help_text in (("sessions", "numbers of growth, downward and unchanged sessions"),
+                               ("measures", "median, mode, standard deviation and coefficient of variation")):
+        command_parser = commands.add_parser(command, parents=[common], help=help_text)
+        command_parser.add_argument("--currencies", nargs="+", required=True, metavar="CODE")
+        command_parser.add_argument(
+            "--periods", nargs="+", type=_parse_period, metavar="PERIOD",
+            help="analysis periods ending today, all if neither periods nor ranges are given"
+        )
+
+    distribution_parser = commands.add_parser(
+        "distribution", parents=[common], help="histograms of daily changes of currency pairs"
+    )
+    distribution_parser.add_argument("--pairs", nargs="+", type=_parse_pair, required=True, metavar="CODE/CODE")
+    distribution_parser.add_argument(
+        "--start-date", type=_parse_date, metavar="YYYY-MM-DD", help="start of the periods, required with periods"
+    )
+    distribution_parser.add_argument(
+        "--periods", nargs="+", type=_parse_distribution_period, metavar="PERIOD",
+        help="MONTH and/or QUARTER, MONTH if neither periods nor ranges are given"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.format == "parquet":
+        if not args.output:
+            parser.error("--output is required for parquet format")
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("parquet format requires pyarrow, install it with `pip install pyarrow`")
+
+    if args.diagnostics:
+        instrumentation.enable()
+
+    match args.command:
+        case "sessions":
+            periods = args.periods or ([] if args.ranges else list(AnalysisPeriod))
+            rows, errors = run_sessions(args.currencies, periods, args.ranges, args.workers)
+            columns = SESSIONS_COLUMNS
+        case "measures":
+            periods = args.periods or ([] if args.ranges else list(AnalysisPeriod))
+            rows, errors = run_measures(args.currencies, periods, args.ranges, args.workers)
+            columns = MEASURES_COLUMNS
+        case _:
+            periods = args.periods or ([] if args.ranges else [AnalysisPeriod.MONTH])
+            if periods and args.start_date is None:
+                parser.error("--start-date is required with periods")
+            rows, errors = run_distribution(args.pairs, args.start_date, periods, args.ranges, args.workers)
+            columns = DISTRIBUTION_COLUMNS
+
+    write_rows(rows, columns, args.format, args.output)
+    if args.diagnostics:
+        instrumentation.export_json(args.diagnostics)
+    for error in errors:
+        print("Error:", error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+from datetime import date
 from enum import Enum
 
 
@@ -8,3 +9,11 @@ class AnalysisPeriod(Enum):
     QUARTER = 4
     HALF_YEAR = 5
     YEAR = 6
+
+
+NBP_API_URL = "http://api.nbp.pl/api"
+NBP_TABLE = "A"
+NBP_FIRST_DATE = date(2002, 1, 2)
+NBP_MAX_DAYS = 93
+# currencies offered on every page, their year of rates is prefetched after start
+OFFERED_CURRENCIES = ["EUR", "USD", "GBP", "JPY", "CHF"]
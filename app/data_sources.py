@@ -0,0 +1,378 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+import requests
+
+from . import http_client, instrumentation
+from .cache import APPROX_RATE_BYTES, ResponseCache
+from .constans import NBP_API_URL, NBP_MAX_DAYS, NBP_TABLE
+from .rate_store import RateStore, get_rate_store
+from .single_flight import SingleFlight
+
+MAX_FETCH_WORKERS = http_client.DEFAULT_POOL_SIZE
+# pseudo currency code under which the store remembers ranges downloaded as whole tables
+ALL_CURRENCIES = "*"
+
+
+def _date_chunks(date_start: date, date_end: date, max_days: int = NBP_MAX_DAYS) -> list[tuple[date, date]]:
+    """
+    Args:
+        date_start (date): First day of the range.
+        date_end (date): Last day of the range.
+        max_days (int): Maximal number of days in one chunk.
+
+    Returns:
+        list: Consecutive (start, end) date ranges covering the range, each at most max_days long.
+    """
+    chunks = []
+    while date_start <= date_end:
+        chunk_end = min(date_start + timedelta(days=max_days - 1), date_end)
+        chunks.append((date_start, chunk_end))
+        date_start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _run_concurrently(fn, args_list: list[tuple]) -> list:
+    """
+    Args:
+        fn (callable): Function to call.
+        args_list (list): Tuples of arguments, fn is called once for each of them.
+
+    Returns:
+        list: Results of the calls, in the order of args_list.
+    """
+    if len(args_list) <= 1:
+        return [fn(*args) for args in args_list]
+
+    with ThreadPoolExecutor(max_workers=min(len(args_list), MAX_FETCH_WORKERS)) as executor:
+        futures = [executor.submit(fn, *args) for args in args_list]
+        return [future.result() for future in futures]
+
+
+def _group_tables(tables: list[dict]) -> dict[str, list[dict]]:
+    """
+    Args:
+        tables (list): NBP tables ordered by date, each with 'effectiveDate' and 'rates' keys.
+
+    Returns:
+        dict: Maps currency code to its rates ordered by date.
+    """
+    currencies_rates = {}
+    for table in tables:
+        for rate in table['rates']:
+            currencies_rates.setdefault(rate['code'], []).append(
+                {'effectiveDate': table['effectiveDate'], 'mid': rate['mid']}
+            )
+    return currencies_rates
+
+
+class DataSource:
+    """
+    Source of NBP mid rates used by the API functions. Rates are dicts with 'effectiveDate' and 'mid'
+    keys ordered by date.
+    """
+
+    def fetch_rates(self, ranges: list[tuple[str, date, date]]) -> list[list[dict] | None]:
+        """
+        Args:
+            ranges (list): Tuples of (currency, date_start, date_end) of any length.
+
+        Returns:
+            list: Rates for every requested range, in the order of ranges. None when the source has no rate
+                of the currency in the range, because the currency is unknown or there was no fixing.
+        """
+        raise NotImplementedError
+
+    def fetch_table_rates(self, date_start: date, date_end: date) -> dict[str, list[dict]]:
+        """
+        Args:
+            date_start (date): First day of the range.
+            date_end (date): Last day of the range.
+
+        Returns:
+            dict: Maps code of every currency in the table to its rates in the range.
+        """
+        raise NotImplementedError
+
+    def fetch_last_table(self) -> dict[str, list[dict]]:
+        """
+        Returns:
+            dict: Maps code of every currency in the latest published table to a list with its single rate,
+                like fetch_table_rates.
+        """
+        raise NotImplementedError
+
+
+class NbpHttpSource(DataSource):
+    """
+    Downloads rates from the NBP API, splitting long ranges into chunks downloaded in parallel.
+    """
+
+    def __init__(self, base_url: str | None = None):
+        """
+        Args:
+            base_url (str | None): Address of the API, NBP_API_URL environment variable or the NBP server if not given.
+        """
+        self.base_url = (base_url or os.environ.get("NBP_API_URL", NBP_API_URL)).rstrip("/")
+        # pages loading together and overlapping batch jobs often ask for the same url at the same time
+        self.flights = SingleFlight()
+        instrumentation.register_gauge("single_flight", self.flights.stats)
+
+    def _download(self, url: str):
+        return self.flights.do(url, self._download_once, url)
+
+    def _download_once(self, url: str):
+        instrumentation.count("http.requests")
+        try:
+            with instrumentation.span("http.wait"):
+                response = http_client.get(url)
+        except requests.RequestException as e:
+            instrumentation.count("http.errors")
+            print("Error:", e)
+            raise
+        if response.status_code == 200:
+            with instrumentation.span("http.json_decode"):
+                return response.json()
+        if response.status_code == 404:
+            return None
+        if response.status_code == 429 or response.status_code >= 500:
+            # still failing after the retries of the session, the request itself may be valid
+            instrumentation.count("http.errors")
+            print("Error:", response.status_code, "NBP API unavailable")
+            response.raise_for_status()
+        raise ValueError("Invalid request parameters")
+
+    def _download_rates(self, currency: str, date_start: date, date_end: date) -> list[dict] | None:
+        url = f"{self.base_url}/exchangerates/rates/{NBP_TABLE}/{currency}/"
+        url = url + date_start.strftime("%Y-%m-%d") + "/" + date_end.strftime("%Y-%m-%d") + "/?format=json"
+        data = self._download(url)
+        return None if data is None else data['rates']
+
+    def _download_table(self, date_start: date, date_end: date) -> list[dict]:
+        url = f"{self.base_url}/exchangerates/tables/{NBP_TABLE}/"
+        url = url + date_start.strftime("%Y-%m-%d") + "/" + date_end.strftime("%Y-%m-%d") + "/?format=json"
+        # whole table is never missing for a valid range, only days without a fixing
+        return self._download(url) or []
+
+    def fetch_rates(self, ranges: list[tuple[str, date, date]]) -> list[list[dict] | None]:
+        ranges_chunks = [
+            [(currency.upper(), chunk_start, chunk_end) for chunk_start, chunk_end in _date_chunks(date_start, date_end)]
+            for currency, date_start, date_end in ranges
+        ]
+        downloads = list(dict.fromkeys(chunk for chunks in ranges_chunks for chunk in chunks))
+        results = dict(zip(downloads, _run_concurrently(self._download_rates, downloads)))
+
+        fetched = []
+        for chunks in ranges_chunks:
+            chunks_rates = [results[chunk] for chunk in chunks]
+            if all(rates is None for rates in chunks_rates):
+                fetched.append(None)
+            else:
+                fetched.append([rate for rates in chunks_rates if rates for rate in rates])
+        return fetched
+
+    def fetch_table_rates(self, date_start: date, date_end: date) -> dict[str, list[dict]]:
+        chunks = _date_chunks(date_start, date_end)
+        tables = _run_concurrently(self._download_table, chunks)
+        return _group_tables([table for chunk_tables in tables for table in chunk_tables])
+
+    def fetch_last_table(self) -> dict[str, list[dict]]:
+        return _group_tables(self._download(f"{self.base_url}/exchangerates/tables/{NBP_TABLE}/last/?format=json") or [])
+
+
+class FixtureSource(DataSource):
+    """
+    Serves rates kept in memory, for example recorded NBP responses.
+    """
+
+    def __init__(self, rates: dict[str, list[dict]], latency: float = 0.0):
+        """
+        Args:
+            rates (dict): Maps currency code to its rates ordered by date.
+            latency (float): Delay in seconds added to every fetch, to simulate a remote server.
+        """
+        self.rates = {currency.upper(): currency_rates for currency, currency_rates in rates.items()}
+        self.latency = latency
+
+    @classmethod
+    def from_directory(cls, path: str | os.PathLike, latency: float = 0.0) -> "FixtureSource":
+        """
+        Args:
+            path (str | PathLike): Directory with NBP responses of the /exchangerates/rates/ endpoint saved as JSON.
+            latency (float): Delay in seconds added to every fetch.
+
+        Returns:
+            FixtureSource: Source serving rates of every currency found in the directory.
+        """
+        rates = {}
+        for file in sorted(Path(path).glob("*.json")):
+            data = json.loads(file.read_text())
+            rates.setdefault(data['code'].upper(), []).extend(data['rates'])
+        for currency_rates in rates.values():
+            currency_rates.sort(key=lambda rate: rate['effectiveDate'])
+        return cls(rates, latency)
+
+    def _select(self, currency: str, date_start: date, date_end: date) -> list[dict]:
+        date_start_str = date_start.strftime("%Y-%m-%d")
+        date_end_str = date_end.strftime("%Y-%m-%d")
+        return [
+            {'effectiveDate': rate['effectiveDate'], 'mid': rate['mid']}
+            for rate in self.rates.get(currency.upper(), [])
+            if date_start_str <= rate['effectiveDate'] <= date_end_str
+        ]
+
+    def fetch_rates(self, ranges: list[tuple[str, date, date]]) -> list[list[dict] | None]:
+        time.sleep(self.latency)
+        return [self._select(*element) or None for element in ranges]
+
+    def fetch_table_rates(self, date_start: date, date_end: date) -> dict[str, list[dict]]:
+        time.sleep(self.latency)
+        all_rates = {currency: self._select(currency, date_start, date_end) for currency in self.rates}
+        return {currency: rates for currency, rates in all_rates.items() if rates}
+
+    def fetch_last_table(self) -> dict[str, list[dict]]:
+        time.sleep(self.latency)
+        last_date = max((rates[-1]['effectiveDate'] for rates in self.rates.values() if rates), default=None)
+        return {
+            currency: [dict(rates[-1])]
+            for currency, rates in self.rates.items() if rates and rates[-1]['effectiveDate'] == last_date
+        }
+
+
+class StoreSource(DataSource):
+    """
+    Reads rates through the local rate store, fetching from the upstream source only ranges that were
+    never fetched before.
+    """
+
+    def __init__(self, upstream: DataSource, store: RateStore | None = None):
+        """
+        Args:
+            upstream (DataSource): Source of the rates missing in the store.
+            store (RateStore | None): Store to read through, the shared store if not given.
+        """
+        self.upstream = upstream
+        self.store = store
+
+    def _get_store(self) -> RateStore:
+        return self.store if self.store is not None else get_rate_store()
+
+    def fetch_rates(self, ranges: list[tuple[str, date, date]]) -> list[list[dict] | None]:
+        store = self._get_store()
+
+        gaps = {}
+        for currency, date_start, date_end in ranges:
+            for gap_start, gap_end in store.missing_ranges(NBP_TABLE, currency, date_start, date_end):
+                gaps[(currency.upper(), gap_start, gap_end)] = None
+        gaps = list(gaps)
+        results = self.upstream.fetch_rates(gaps) if gaps else []
+
+        # no data in every gap of a currency never seen before means the currency code is invalid,
+        # otherwise the gap simply has no fixing (weekend, holiday)
+        found = {currency for (currency, _, _), rates in zip(gaps, results) if rates is not None}
+        invalid = {
+            currency for currency, _, _ in gaps
+            if currency not in found and not store.has_currency(NBP_TABLE, currency)
+        }
+
+        for (currency, gap_start, gap_end), rates in zip(gaps, results):
+            if currency not in invalid:
+                store.add_rates(NBP_TABLE, currency, rates or [], gap_start, gap_end)
+
+        return [
+            None if currency.upper() in invalid else store.get_rates(NBP_TABLE, currency, date_start, date_end)
+            for currency, date_start, date_end in ranges
+        ]
+
+    def fetch_table_rates(self, date_start: date, date_end: date) -> dict[str, list[dict]]:
+        store = self._get_store()
+
+        for gap_start, gap_end in store.missing_ranges(NBP_TABLE, ALL_CURRENCIES, date_start, date_end):
+            for currency, rates in self.upstream.fetch_table_rates(gap_start, gap_end).items():
+                store.add_rates(NBP_TABLE, currency, rates, gap_start, gap_end)
+            store.add_rates(NBP_TABLE, ALL_CURRENCIES, [], gap_start, gap_end)
+
+        return store.get_all_rates(NBP_TABLE, date_start, date_end)
+
+    def fetch_last_table(self) -> dict[str, list[dict]]:
+        store = self._get_store()
+
+        last_table = self.upstream.fetch_last_table()
+        for currency, rates in last_table.items():
+            day = date.fromisoformat(rates[0]['effectiveDate'])
+            store.add_rates(NBP_TABLE, currency, rates, day, day)
+        return last_table
+
+
+class CachedSource(DataSource):
+    """
+    Keeps rates fetched from the upstream source in an in-process cache, shared by all callers.
+    """
+
+    def __init__(self, upstream: DataSource, cache: ResponseCache | None = None):
+        """
+        Args:
+            upstream (DataSource): Source of the rates missing in the cache.
+            cache (ResponseCache | None): Cache of the rates, a new one with default limits if not given.
+        """
+        self.upstream = upstream
+        self.cache = cache if cache is not None else ResponseCache()
+        instrumentation.register_gauge("response_cache", self.cache.stats)
+
+    def fetch_rates(self, ranges: list[tuple[str, date, date]]) -> list[list[dict] | None]:
+        keys = [(currency.upper(), date_start, date_end) for currency, date_start, date_end in ranges]
+        fetched = [self.cache.get(key) for key in keys]
+
+        missing = list(dict.fromkeys(key for key, rates in zip(keys, fetched) if rates is None))
+        if not missing:
+            return fetched
+
+        results = dict(zip(missing, self.upstream.fetch_rates(missing)))
+        for key, rates in results.items():
+            if rates is not None:
+                self.cache.put(key, rates, key[2], len(rates) * APPROX_RATE_BYTES)
+        return [results[key] if rates is None else rates for key, rates in zip(keys, fetched)]
+
+    def fetch_table_rates(self, date_start: date, date_end: date) -> dict[str, list[dict]]:
+        key = (ALL_CURRENCIES, date_start, date_end)
+        all_rates = self.cache.get(key)
+        if all_rates is None:
+            all_rates = self.upstream.fetch_table_rates(date_start, date_end)
+            size = sum(len(rates) for rates in all_rates.values()) * APPROX_RATE_BYTES
+            self.cache.put(key, all_rates, date_end, size)
+        return all_rates
+
+    def fetch_last_table(self) -> dict[str, list[dict]]:
+        return self.upstream.fetch_last_table()
+
+
+_data_source: DataSource | None = None
+_data_source_lock = threading.Lock()
+
+
+def get_data_source() -> DataSource:
+    """
+    Returns:
+        DataSource: Source used by the API functions, by default the NBP API read through the rate store
+            and an in-memory cache.
+    """
+    global _data_source
+    with _data_source_lock:
+        if _data_source is None:
+            _data_source = CachedSource(StoreSource(NbpHttpSource()))
+        return _data_source
+
+
+def set_data_source(data_source: DataSource | None):
+    """
+    Args:
+        data_source (DataSource | None): Source used by the API functions, None to restore the default one.
+    """
+    global _data_source
+    with _data_source_lock:
+        _data_source = data_source
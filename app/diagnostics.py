@@ -0,0 +1,89 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QCheckBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel, QPushButton, \
+    QTableWidget, QTableWidgetItem, QVBoxLayout
+
+from app import instrumentation
+
+SPAN_COLUMNS = ["Span", "Count", "Mean [ms]", "Max [ms]", "Last [ms]", "Total [ms]"]
+REFRESH_INTERVAL_MS = 1000
+
+
+class DiagnosticsDialog(QDialog):
+    """
+    Shows timings of spans, counters and gauges recorded by app.instrumentation, refreshed every second
+    while the dialog is open.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.resize(640, 420)
+
+        self.checkBoxEnabled = QCheckBox("Record timings")
+        self.checkBoxEnabled.setChecked(instrumentation.is_enabled())
+        self.checkBoxEnabled.toggled.connect(instrumentation.enable)
+
+        self.tableWidgetSpans = QTableWidget(0, len(SPAN_COLUMNS))
+        self.tableWidgetSpans.setHorizontalHeaderLabels(SPAN_COLUMNS)
+        self.tableWidgetSpans.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tableWidgetSpans.verticalHeader().setVisible(False)
+
+        self.labelCounters = QLabel()
+        self.labelCounters.setWordWrap(True)
+
+        self.pushButtonReset = QPushButton("Reset")
+        self.pushButtonReset.clicked.connect(self.on_reset)
+        self.pushButtonExport = QPushButton("Export JSON...")
+        self.pushButtonExport.clicked.connect(self.on_export)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.checkBoxEnabled)
+        buttons.addStretch()
+        buttons.addWidget(self.pushButtonReset)
+        buttons.addWidget(self.pushButtonExport)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(buttons)
+        layout.addWidget(self.tableWidgetSpans)
+        layout.addWidget(self.labelCounters)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(REFRESH_INTERVAL_MS)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        snapshot = instrumentation.snapshot()
+
+        spans = snapshot['spans']
+        self.tableWidgetSpans.setRowCount(len(spans))
+        for row, (name, stats) in enumerate(spans.items()):
+            values = [name, str(stats['count'])] + [
+                f"{stats[key] * 1000:.2f}" for key in ('mean', 'max', 'last', 'total')
+            ]
+            for column, value in enumerate(values):
+                self.tableWidgetSpans.setItem(row, column, QTableWidgetItem(value))
+
+        lines = [f"{name}: {value}" for name, value in snapshot['counters'].items()]
+        for name, values in snapshot['gauges'].items():
+            lines.append(f"{name}: " + ", ".join(
+                f"{key} {value:.1%}" if key == 'hit_rate' else f"{key} {value}" for key, value in values.items()
+            ))
+        self.labelCounters.setText("\n".join(lines) or "Nothing recorded yet")
+
+    def on_reset(self):
+        instrumentation.reset()
+        self.refresh()
+
+    def on_export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export diagnostics", "diagnostics.json", "JSON (*.json)")
+        if path:
+            instrumentation.export_json(path)
@@ -0,0 +1,108 @@
+import statistics
+
+import numpy as np
+
+from .instrumentation import timed
+
+
+def to_array(rates: list[dict]) -> np.ndarray:
+    """
+    Args:
+        rates (list): Rates ordered by date, dicts with 'mid' key.
+
+    Returns:
+        np.ndarray: float64 array of the mid rates.
+    """
+    return np.fromiter((rate['mid'] for rate in rates), dtype=np.float64, count=len(rates))
+
+
+@timed("compute.sessions")
+def count_sessions(mid_values: np.ndarray) -> tuple[int, int, int]:
+    """
+    Counts runs of consecutive days with the same direction of change.
+
+    Args:
+        mid_values (np.ndarray): Mid rates ordered by date.
+
+    Returns:
+        tuple: Number of growth sessions, decline sessions and unchanged sessions.
+    """
+    signs = np.sign(np.diff(mid_values))
+    if signs.size == 0:
+        return 0, 0, 0
+
+    run_starts = np.empty(signs.size, dtype=bool)
+    run_starts[0] = True
+    np.not_equal(signs[1:], signs[:-1], out=run_starts[1:])
+    run_signs = signs[run_starts]
+
+    rising_sessions = int(np.count_nonzero(run_signs > 0))
+    falling_sessions = int(np.count_nonzero(run_signs < 0))
+    no_changes = int(run_signs.size) - rising_sessions - falling_sessions
+
+    return rising_sessions, falling_sessions, no_changes
+
+
+@timed("compute.statistical_measures")
+def calculate_statistical_measures(mid_values: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Args:
+        mid_values (np.ndarray): Mid rates, in any order.
+
+    Returns:
+        tuple: Median, mode, standard deviation and coefficient of variation. When several values are
+            equally common, the smallest one is the mode.
+    """
+    if mid_values.size < 2:
+        raise statistics.StatisticsError("at least two data points are required")
+
+    values, counts = np.unique(mid_values, return_counts=True)
+    mode = values[np.argmax(counts)]
+
+    median_value = np.median(mid_values)
+    standard_deviation = np.std(mid_values, ddof=1)
+    mean_value = np.mean(mid_values)
+    coefficient_of_variation = standard_deviation/mean_value
+
+    return float(median_value), float(mode), float(standard_deviation), float(coefficient_of_variation)
+
+
+def column_histograms(values: np.ndarray, bins: int, shared_edges: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Histograms of every column in one pass, each equal to np.histogram(column, bins).
+
+    Args:
+        values (np.ndarray): Array of shape (rows, columns).
+        bins (int): Number of equal width bins.
+        shared_edges (bool): Use one set of bin edges spanning all columns instead of one set per column.
+
+    Returns:
+        tuple: Counts of shape (columns, bins) and bin edges of shape (columns, bins + 1).
+    """
+    rows, columns = values.shape
+    if rows == 0:
+        low = np.zeros(columns)
+        high = np.ones(columns)
+    elif shared_edges:
+        low = np.full(columns, values.min())
+        high = np.full(columns, values.max())
+    else:
+        low = values.min(axis=0)
+        high = values.max(axis=0)
+    # the same widening of an empty range as np.histogram
+    empty_range = low == high
+    low = np.where(empty_range, low - 0.5, low)
+    high = np.where(empty_range, high + 0.5, high)
+    edges = np.linspace(low, high, bins + 1, axis=-1)
+
+    # bin of every value computed like np.histogram, then corrected against the exact edges
+    indices = ((values - low) * (bins / (high - low))).astype(np.intp)
+    indices[indices == bins] -= 1
+    column_edges = edges.T
+    column_numbers = np.arange(columns)
+    indices[values < column_edges[indices, column_numbers]] -= 1
+    indices[(values >= column_edges[indices + 1, column_numbers]) & (indices != bins - 1)] += 1
+
+    # one bincount for all columns, with the bins of every column shifted past the previous ones
+    counts = np.bincount((indices + column_numbers * bins).ravel(), minlength=columns * bins)
+    return counts.reshape(columns, bins), edges
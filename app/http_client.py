@@ -0,0 +1,88 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = (3.05, 10.0)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_POOL_SIZE = 8
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_lock = threading.Lock()
+_session: requests.Session | None = None
+_timeout = DEFAULT_TIMEOUT
+_retries = DEFAULT_RETRIES
+_backoff_factor = DEFAULT_BACKOFF_FACTOR
+_pool_size = DEFAULT_POOL_SIZE
+
+
+def _create_session() -> requests.Session:
+    retry = Retry(
+        total=_retries,
+        backoff_factor=_backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(pool_connections=_pool_size, pool_maxsize=_pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def configure(
+        timeout: float | tuple[float, float] | None = None,
+        retries: int | None = None,
+        backoff_factor: float | None = None,
+        pool_size: int | None = None
+):
+    """
+    Changes settings of the shared client, the session is recreated on next request.
+
+    Args:
+        timeout (float | tuple | None): Timeout in seconds, or (connect, read) timeouts.
+        retries (int | None): Number of retries for connection errors and 429/5xx responses.
+        backoff_factor (float | None): Base of the exponential delay between retries, in seconds.
+        pool_size (int | None): Number of kept-alive connections per host.
+    """
+    global _session, _timeout, _retries, _backoff_factor, _pool_size
+    with _lock:
+        if timeout is not None:
+            _timeout = timeout
+        if retries is not None:
+            _retries = retries
+        if backoff_factor is not None:
+            _backoff_factor = backoff_factor
+        if pool_size is not None:
+            _pool_size = pool_size
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def get_session() -> requests.Session:
+    """
+    Returns:
+        requests.Session: Session shared by all API functions, keeping connections alive between requests.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _create_session()
+        return _session
+
+
+def get(url: str) -> requests.Response:
+    """
+    Args:
+        url (str): Address to request.
+
+    Returns:
+        requests.Response: Response of the last attempt, after retries of failed requests.
+    """
+    return get_session().get(url, timeout=_timeout)
@@ -0,0 +1,174 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+
+# set to 1 to record timings from the start, they can also be switched on in the diagnostics dialog (Ctrl+D)
+ENABLE_VARIABLE = "APP_INSTRUMENTATION"
+MAX_EVENTS = 500
+
+_lock = threading.Lock()
+_enabled = os.environ.get(ENABLE_VARIABLE, "") not in ("", "0")
+_spans = {}  # name -> [count, total, min, max, last]
+_counters = {}
+_events = deque(maxlen=MAX_EVENTS)
+_gauges = {}
+# context manager returned while recording is off, shared because it keeps no state
+_NULL_SPAN = nullcontext()
+
+
+def enable(enabled: bool = True):
+    """
+    Args:
+        enabled (bool): Whether spans and counters are recorded.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """
+    Forgets all recorded spans, counters and events.
+    """
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+        _events.clear()
+
+
+class _Span:
+    __slots__ = ("name", "start", "wall_start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start
+        with _lock:
+            stats = _spans.get(self.name)
+            if stats is None:
+                _spans[self.name] = [1, duration, duration, duration, duration]
+            else:
+                stats[0] += 1
+                stats[1] += duration
+                stats[2] = min(stats[2], duration)
+                stats[3] = max(stats[3], duration)
+                stats[4] = duration
+            _events.append({
+                'name': self.name,
+                'start': self.wall_start,
+                'duration': duration,
+                'thread': threading.current_thread().name,
+                'failed': exc_info[0] is not None,
+            })
+        return False
+
+
+def span(name: str):
+    """
+    Measures the time spent in a with block, for example `with span("http.wait"): ...`.
+
+    Args:
+        name (str): Name under which the time is recorded, dot separated like "http.wait".
+
+    Returns:
+        Context manager recording the span, doing nothing while recording is off.
+    """
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name: str):
+    """
+    Decorator recording every call of the function as a span.
+
+    Args:
+        name (str): Name of the span.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name: str, value: int = 1):
+    """
+    Args:
+        name (str): Name of the counter, like "http.requests".
+        value (int): Added to the counter.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def register_gauge(name: str, fn):
+    """
+    Args:
+        name (str): Name of the gauge, replaces a gauge registered before under this name.
+        fn (callable): Returns current values reported with every snapshot, for example ResponseCache.stats.
+    """
+    with _lock:
+        _gauges[name] = fn
+
+
+def snapshot() -> dict:
+    """
+    Returns:
+        dict: Recording state, statistics of every span in seconds, counters, values of gauges and
+            the latest events ordered by time.
+    """
+    with _lock:
+        spans = {
+            name: {
+                'count': stats[0],
+                'total': stats[1],
+                'mean': stats[1] / stats[0],
+                'min': stats[2],
+                'max': stats[3],
+                'last': stats[4],
+            }
+            for name, stats in sorted(_spans.items())
+        }
+        counters = dict(sorted(_counters.items()))
+        events = list(_events)
+        gauges = dict(_gauges)
+    return {
+        'enabled': _enabled,
+        'spans': spans,
+        'counters': counters,
+        'gauges': {name: fn() for name, fn in sorted(gauges.items())},
+        'events': events,
+    }
+
+
+def export_json(path: str | os.PathLike | None = None) -> str:
+    """
+    Args:
+        path (str | PathLike | None): File the snapshot is written to, only returned if not given.
+
+    Returns:
+        str: Snapshot formatted as JSON.
+    """
+    text = json.dumps(snapshot(), indent=2)
+    if path is not None:
+        with open(path, "w") as file:
+            file.write(text + "\n")
+    return text
@@ -0,0 +1,343 @@
+import statistics
+from collections import deque
+from datetime import date, timedelta
+
+import numpy as np
+
+from .api import (
+    HISTOGRAM_BINS, _check_range, _get_distribution_range, _get_period_start, _get_rates, _get_rates_concurrently
+)
+from .constans import AnalysisPeriod, NBP_FIRST_DATE
+from .data_sources import get_data_source
+from .instrumentation import span
+from .rolling import RollingSessions, RollingStatistics
+from .series import JOIN_INNER, RateSeries, align
+
+
+def get_last_fixings() -> tuple[date | None, dict[str, float]]:
+    """
+    Downloads the latest published NBP table, a single small request.
+
+    Returns:
+        tuple: Effective date of the table, None if nothing was published, and mid rate of every currency in it.
+    """
+    last_table = get_data_source().fetch_last_table()
+    if not last_table:
+        return None, {}
+
+    last_date = max(rates[-1]['effectiveDate'] for rates in last_table.values())
+    return date.fromisoformat(last_date), {
+        currency: rates[-1]['mid'] for currency, rates in last_table.items() if rates[-1]['effectiveDate'] == last_date
+    }
+
+
+def _follows(last_day: date, day: date) -> bool:
+    """
+    Args:
+        last_day (date): Effective date of the last table already seen.
+        day (date): Effective date of a new table.
+
+    Returns:
+        bool: Whether no table can be missing between the days. Tables are published on working days, so
+            only a weekend lies between consecutive tables, holidays in between are taken as missed tables.
+    """
+    return not np.busday_count(last_day + timedelta(days=1), day)
+
+
+class _PeriodWindow:
+    def __init__(self):
+        self.dates = deque()
+        self.sessions = RollingSessions()
+        self.statistics = RollingStatistics()
+
+    def push(self, day: date, mid: float):
+        self.dates.append(day)
+        self.sessions.push(mid)
+        self.statistics.push(mid)
+
+    def drop_before(self, date_start: date) -> bool:
+        dropped = False
+        while self.dates and self.dates[0] < date_start:
+            self.dates.popleft()
+            self.sessions.pop()
+            self.statistics.pop()
+            dropped = True
+        return dropped
+
+
+class LiveAnalysis:
+    """
+    Sessions and statistical measures of one currency for every analysis period ending today, updated in place
+    when a new fixing is published instead of downloading the series again.
+    """
+
+    def __init__(self, currency: str, rates: RateSeries, date_today: date):
+        """
+        Args:
+            currency (str): The currency code.
+            rates (RateSeries): Rates of the currency in the year ending on date_today.
+            date_today (date): Last day of the analysis periods.
+        """
+        self.currency = currency.upper()
+        self.date_today = date_today
+        self.last_date = rates.dates[-1].item() if len(rates) else None
+        self._windows = {}
+        for period in AnalysisPeriod:
+            window = _PeriodWindow()
+            period_rates = rates.since(_get_period_start(date_today, period))
+            for day, mid in zip(period_rates.dates.tolist(), period_rates.mids.tolist()):
+                window.push(day, mid)
+            self._windows[period] = window
+
+    def advance(self, date_today: date) -> bool:
+        """
+        Moves the end of the analysis periods, dropping rates that are no longer in them.
+
+        Args:
+            date_today (date): New last day of the analysis periods.
+
+        Returns:
+            bool: Whether any rate was dropped.
+        """
+        self.date_today = max(self.date_today, date_today)
+        dropped = [
+            window.drop_before(_get_period_start(self.date_today, period)) for period, window in self._windows.items()
+        ]
+        return any(dropped)
+
+    def misses_tables(self, day: date) -> bool:
+        """
+        Args:
+            day (date): Effective date of new fixings.
+
+        Returns:
+            bool: Whether tables published between the last rate of the analysis and the day may have been
+                missed, for example when checks for new fixings failed for a whole day. The analysis has to
+                be loaded again then.
+        """
+        return self.last_date is not None and day > self.last_date and not _follows(self.last_date, day)
+
+    def update(self, day: date, fixings: dict[str, float]) -> bool:
+        """
+        Args:
+            day (date): Effective date of the fixings.
+            fixings (dict): Maps currency code to its mid rate on the day.
+
+        Returns:
+            bool: Whether the analysis changed, because a new rate of the currency was added or the periods
+                moved past some rates. Fixings after missed tables are not added, see misses_tables.
+        """
+        dropped = self.advance(day)
+        if self.currency not in fixings or (self.last_date is not None and day <= self.last_date):
+            return dropped
+        if self.misses_tables(day):
+            return dropped
+
+        for window in self._windows.values():
+            window.push(day, fixings[self.currency])
+        self.last_date = day
+        return True
+
+    def sessions_data(self) -> dict[AnalysisPeriod, tuple[int, int, int]]:
+        """
+        Returns:
+            dict: Maps every AnalysisPeriod to the tuple returned by api.get_sessions_data.
+        """
+        return {period: window.sessions.sessions() for period, window in self._windows.items()}
+
+    def statistical_measures(self) -> dict[AnalysisPeriod, tuple[float, float, float, float]]:
+        """
+        Returns:
+            dict: Maps every AnalysisPeriod to the tuple returned by api.get_statistical_measures.
+        """
+        if any(len(window.statistics) < 2 for window in self._windows.values()):
+            raise statistics.StatisticsError("at least two data points are required")
+        return {period: window.statistics.measures() for period, window in self._windows.items()}
+
+
+# days loaded before and after the window asked for, so that moving its start date is served from memory
+SCRUB_MARGIN_DAYS = 366
+
+
+class PairChanges:
+    """
+    Daily changes of a currency pair over a long range, kept in memory to compute histograms of any window
+    in the range by slicing, without downloading the rates again when the start date of the window moves.
+    """
+
+    def __init__(
+            self, currency_1: str, currency_2: str, rates1: RateSeries, rates2: RateSeries, date_start: date,
+            date_end: date, join: str = JOIN_INNER
+    ):
+        """
+        Args:
+            currency_1 (str): The currency code for the first currency.
+            currency_2 (str): The currency code for the second currency.
+            rates1 (RateSeries): Rates of the first currency in the range.
+            rates2 (RateSeries): Rates of the second currency in the range.
+            date_start (date): First day of the range.
+            date_end (date): Last day of the range, not later than today.
+            join (str): JOIN_INNER or JOIN_FFILL, see api.get_changes_distribution.
+        """
+        self.currency_1 = currency_1.upper()
+        self.currency_2 = currency_2.upper()
+        self.date_start = date_start
+        self.date_end = date_end
+        self.join = join
+        self._dates = [rates1.dates, rates2.dates]
+        self.days, mids = align([rates1, rates2], join)
+        self._last_mids = (float(mids[0, -1]), float(mids[1, -1])) if len(self.days) else None
+        # change i is the change from days[i] to days[i + 1]
+        self.changes = np.diff(mids[1] / mids[0]) if len(self.days) else np.empty(0)
+
+    def covers(self, date_start: date, date_end: date) -> bool:
+        """
+        Args:
+            date_start (date): First day of the window.
+            date_end (date): Last day of the window.
+
+        Returns:
+            bool: Whether the window lies within the range kept in memory.
+        """
+        return self.date_start <= date_start and date_end <= self.date_end
+
+    def _window_slice(self, date_start: date, date_end: date) -> slice:
+        # like align on rates of the window only, days before every currency has a rate in the window are skipped
+        day_start = np.datetime64(date_start, "D")
+        for dates in self._dates:
+            index = int(np.searchsorted(dates, day_start))
+            if index == len(dates):
+                raise ValueError("Data inconsistency")
+            day_start = max(day_start, dates[index])
+
+        first = int(np.searchsorted(self.days, day_start))
+        last = int(np.searchsorted(self.days, np.datetime64(date_end, "D"), "right"))
+        if first >= last:
+            raise ValueError("Data inconsistency")
+        return slice(first, last - 1)
+
+    def window(self, date_start: date, date_end: date) -> np.ndarray:
+        """
+        Args:
+            date_start (date): First day of the window.
+            date_end (date): Last day of the window.
+
+        Returns:
+            np.ndarray: View of the daily changes between days of the window.
+        """
+        return self.changes[self._window_slice(date_start, date_end)]
+
+    def histogram(self, date_start: date, date_end: date) -> tuple[list, list]:
+        """
+        Args:
+            date_start (date): First day of the window.
+            date_end (date): Last day of the window.
+
+        Returns:
+            tuple: Histogram values and bins boundaries of the daily changes in the window, like
+                api.get_changes_distribution.
+        """
+        return np.histogram(self.window(date_start, date_end), bins=HISTOGRAM_BINS)
+
+    def misses_tables(self, day: date) -> bool:
+        """
+        Args:
+            day (date): Effective date of new fixings.
+
+        Returns:
+            bool: Whether tables published between the last day of the changes and the day are not in memory,
+                because the range ended in the past or checks for new fixings failed.
+        """
+        return self._last_mids is not None and day > self.days[-1].item() and not _follows(self.days[-1].item(), day)
+
+    def update(self, day: date, fixings: dict[str, float]) -> bool:
+        """
+        Args:
+            day (date): Effective date of the fixings.
+            fixings (dict): Maps currency code to its mid rate on the day.
+
+        Returns:
+            bool: Whether a new change was added at the end of the range. Fixings after tables missing in
+                memory are not added, so the range does not extend over days without data and windows
+                reaching them are loaded again.
+        """
+        if self._last_mids is None or day <= self.days[-1].item() or self.misses_tables(day):
+            return False
+        if self.join == JOIN_INNER and not (self.currency_1 in fixings and self.currency_2 in fixings):
+            return False
+        if self.currency_1 not in fixings and self.currency_2 not in fixings:
+            return False
+
+        day64 = np.datetime64(day, "D")
+        for index, currency in enumerate((self.currency_1, self.currency_2)):
+            if currency in fixings:
+                self._dates[index] = np.append(self._dates[index], day64)
+        mids = (fixings.get(self.currency_1, self._last_mids[0]), fixings.get(self.currency_2, self._last_mids[1]))
+        change = mids[1] / mids[0] - self._last_mids[1] / self._last_mids[0]
+
+        self.days = np.append(self.days, day64)
+        self.changes = np.append(self.changes, change)
+        self._last_mids = mids
+        self.date_end = max(self.date_end, day)
+        return True
+
+
+def load_live_analysis(currency: str) -> LiveAnalysis:
+    """
+    Args:
+        currency (str): The currency code.
+
+    Returns:
+        LiveAnalysis: Analysis of the currency for every period ending today, from one download of the year.
+    """
+    date_today = date.today()
+    rates = _get_rates(currency, _get_period_start(date_today, AnalysisPeriod.YEAR), date_today)
+    with span("compute.live_analysis"):
+        return LiveAnalysis(currency, rates, date_today)
+
+
+def prefetch_year(currency: str):
+    """
+    Loads rates of the currency in the year ending today into the rate store and the response cache, so that
+    load_live_analysis of the currency needs no download.
+
+    Args:
+        currency (str): The currency code.
+    """
+    date_today = date.today()
+    _get_rates(currency, _get_period_start(date_today, AnalysisPeriod.YEAR), date_today)
+
+
+def get_distribution_window(start_date: date, analysisPeriod: AnalysisPeriod) -> tuple[date, date]:
+    """
+    Args:
+        start_date (date): The start date for analyzing the changes.
+        analysisPeriod (AnalysisPeriod): MONTH or QUARTER.
+
+    Returns:
+        tuple: First and last day of the rates used by api.get_changes_distribution.
+    """
+    return _check_range(*_get_distribution_range(start_date, analysisPeriod))
+
+
+def load_pair_changes(
+        currency_1: str, currency_2: str, date_start: date, date_end: date, join: str = JOIN_INNER
+) -> PairChanges:
+    """
+    Args:
+        currency_1 (str): The currency code for the first currency.
+        currency_2 (str): The currency code for the second currency.
+        date_start (date): First day of the window shown first.
+        date_end (date): Last day of the window shown first.
+        join (str): JOIN_INNER or JOIN_FFILL, see api.get_changes_distribution.
+
+    Returns:
+        PairChanges: Changes of the pair from SCRUB_MARGIN_DAYS before the window to SCRUB_MARGIN_DAYS after it,
+            within the days published so far.
+    """
+    range_start, range_end = _check_range(
+        max(NBP_FIRST_DATE, date_start - timedelta(days=SCRUB_MARGIN_DAYS)), date_end + timedelta(days=SCRUB_MARGIN_DAYS)
+    )
+    rates1, rates2 = _get_rates_concurrently([(currency_1, range_start, range_end), (currency_2, range_start, range_end)])
+    with span("compute.pair_changes"):
+        return PairChanges(currency_1, currency_2, rates1, rates2, range_start, range_end, join)
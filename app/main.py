@@ -1,16 +1,36 @@
 # You can ran this file from the root directory of the project by running `python -m app.main`
 from datetime import date, datetime, timedelta
 
-from PySide6.QtCore import QDate, QObject
+from PySide6.QtCore import QDate, QObject, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QApplication, QMessageBox, QTableWidgetItem, QMainWindow, QButtonGroup, QHeaderView, \
     QAbstractItemView
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-from app.api import get_sessions_data, get_statistical_measures, get_changes_distribution
+from app import instrumentation
 from app.app_ui import Ui_MainWindow
-from app.constans import AnalysisPeriod
+from app.constans import AnalysisPeriod, OFFERED_CURRENCIES
+from app.workers import Prefetcher, RatesPoller, RequestRunner, UpdateScheduler
+
+LOADING_PLACEHOLDER = "..."
+# time after the window is shown before offered currencies are prefetched, so the first paint is not slowed down
+PREFETCH_DELAY_MS = 1000
+MAIN_PAGE, DISTRIBUTION_PAGE, SESSIONS_PAGE, MEASURES_PAGE = range(4)
+
+
+def call_live(name, *args):
+    """
+    Calls a function of app.live, importing it on first use so numpy and requests are not loaded before
+    the main menu is shown.
+
+    Args:
+        name (str): Name of the function.
+        *args: Arguments passed to the function.
+
+    Returns:
+        Result of the function.
+    """
+    from app import live
+    return getattr(live, name)(*args)
 
 
 class MainWindow(QMainWindow):
@@ -21,36 +41,85 @@ class MainWindow(QMainWindow):
 
         self.setFixedSize(800, 600)
 
-        self.ui.stackedWidget.setCurrentIndex(0)
+        self.ui.stackedWidget.setCurrentIndex(MAIN_PAGE)
+
+        # pages other than the main menu are set up when they are opened for the first time
+        self.page_setups = {
+            DISTRIBUTION_PAGE: self.setup_distribution_page,
+            SESSIONS_PAGE: self.setup_sessions_page,
+            MEASURES_PAGE: self.setup_measures_page,
+        }
+
+        # analyses shown on the pages, updated in place when new fixings are published
+        self.sessions_analysis = None
+        self.measures_analysis = None
+        # daily changes of every currency pair shown on the distribution page, by pair
+        self.pair_changes = {}
+        self.distribution_window = None
 
         self.setup_main_page()
 
-        self.setup_distribution_page()
+        self.diagnostics_dialog = None
+        QShortcut(QKeySequence("Ctrl+D"), self).activated.connect(self.show_diagnostics)
 
-        self.setup_sessions_page()
+        self.poller = RatesPoller(lambda: call_live("get_last_fixings"), parent=self)
+        self.poller.new_fixings.connect(self.on_new_fixings)
+        self.poller.start()
 
-        self.setup_measures_page()
+        # after the warm-up changing the currency of a page needs no download
+        self.prefetcher = Prefetcher(
+            call_live, [("prefetch_year", currency) for currency in OFFERED_CURRENCIES], parent=self
+        )
+        self.prefetch_started = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.prefetch_started:
+            self.prefetch_started = True
+            QTimer.singleShot(PREFETCH_DELAY_MS, self.prefetcher.start)
 
     def setup_main_page(self):
-        self.ui.pushButtonGotoDistribution.clicked.connect(lambda: self.ui.stackedWidget.setCurrentIndex(1))
-        self.ui.pushButtonGotoSessions.clicked.connect(lambda: self.ui.stackedWidget.setCurrentIndex(2))
-        self.ui.pushButtonGotoMeasures.clicked.connect(lambda: self.ui.stackedWidget.setCurrentIndex(3))
+        self.ui.pushButtonGotoDistribution.clicked.connect(lambda: self.show_page(DISTRIBUTION_PAGE))
+        self.ui.pushButtonGotoSessions.clicked.connect(lambda: self.show_page(SESSIONS_PAGE))
+        self.ui.pushButtonGotoMeasures.clicked.connect(lambda: self.show_page(MEASURES_PAGE))
+
+    def show_page(self, index):
+        setup = self.page_setups.pop(index, None)
+        if setup is not None:
+            setup()
+        self.ui.stackedWidget.setCurrentIndex(index)
 
     def setup_sessions_page(self):
-        self.ui.pushButtonBackToMain2.clicked.connect(lambda: self.ui.stackedWidget.setCurrentIndex(0))
-        self.ui.comboBoxSessions.addItems(["EUR", "USD", "GBP", "JPY", "CHF"])
+        self.ui.pushButtonBackToMain2.clicked.connect(lambda: self.show_page(MAIN_PAGE))
+        self.ui.comboBoxSessions.addItems(OFFERED_CURRENCIES)
         self.ui.tableWidgetSessions.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
         self.ui.tableWidgetSessions.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.ui.tableWidgetSessions.horizontalHeader().setSectionsClickable(False)
         self.ui.tableWidgetSessions.verticalHeader().setSectionsClickable(False)
         self.ui.comboBoxSessions.setCurrentIndex(0)
-        self.ui.comboBoxSessions.currentIndexChanged.connect(self.on_update_sessions)
+
+        self.sessions_runner = RequestRunner(self)
+        self.sessions_runner.started.connect(lambda: self.show_placeholders(self.ui.tableWidgetSessions))
+        self.sessions_runner.finished.connect(self.on_sessions_loaded)
+        self.sessions_runner.failed.connect(self.show_error)
+
+        # scrolling through the currencies loads only the one it stops at
+        self.sessions_scheduler = UpdateScheduler(self.on_update_sessions, parent=self)
+        self.ui.comboBoxSessions.currentIndexChanged.connect(self.sessions_scheduler.schedule)
 
         self.on_update_sessions()
 
     def on_update_sessions(self):
-        for period in AnalysisPeriod:
-            data = get_sessions_data(self.ui.comboBoxSessions.currentText(), period)
+        self.sessions_analysis = None
+        self.sessions_runner.submit(call_live, "load_live_analysis", self.ui.comboBoxSessions.currentText())
+
+    def on_sessions_loaded(self, analysis):
+        self.sessions_analysis = analysis
+        self.show_sessions(analysis.sessions_data())
+
+    @instrumentation.timed("qt.table_fill")
+    def show_sessions(self, all_data):
+        for period, data in all_data.items():
             i = 0
             for value in data:
                 item = QTableWidgetItem(str(value))
@@ -58,20 +127,43 @@ class MainWindow(QMainWindow):
                 i += 1
 
     def setup_measures_page(self):
-        self.ui.pushButtonBackToMain1.clicked.connect(lambda: self.ui.stackedWidget.setCurrentIndex(0))
+        self.ui.pushButtonBackToMain1.clicked.connect(lambda: self.show_page(MAIN_PAGE))
 
-        self.ui.comboBoxMeasures.addItems(["EUR", "USD", "GBP", "JPY", "CHF"])
+        self.ui.comboBoxMeasures.addItems(OFFERED_CURRENCIES)
         self.ui.comboBoxMeasures.setCurrentIndex(0)
         self.ui.tableWidgetMeasures.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
         self.ui.tableWidgetMeasures.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.ui.tableWidgetMeasures.horizontalHeader().setSectionsClickable(False)
         self.ui.tableWidgetMeasures.verticalHeader().setSectionsClickable(False)
+
+        self.measures_runner = RequestRunner(self)
+        self.measures_runner.started.connect(lambda: self.show_placeholders(self.ui.tableWidgetMeasures))
+        self.measures_runner.finished.connect(self.on_measures_loaded)
+        self.measures_runner.failed.connect(self.show_error)
+
+        self.measures_scheduler = UpdateScheduler(self.on_update_measures, parent=self)
         self.on_update_measures()
-        self.ui.comboBoxMeasures.currentIndexChanged.connect(self.on_update_measures)
+        self.ui.comboBoxMeasures.currentIndexChanged.connect(self.measures_scheduler.schedule)
 
     def on_update_measures(self):
-        for period in AnalysisPeriod:
-            data = get_statistical_measures(self.ui.comboBoxMeasures.currentText(), period)
+        self.measures_analysis = None
+        self.measures_runner.submit(call_live, "load_live_analysis", self.ui.comboBoxMeasures.currentText())
+
+    def on_measures_loaded(self, analysis):
+        self.measures_analysis = analysis
+        self.refresh_measures()
+
+    def refresh_measures(self):
+        try:
+            all_data = self.measures_analysis.statistical_measures()
+        except Exception as e:
+            self.show_error(str(e))
+        else:
+            self.show_measures(all_data)
+
+    @instrumentation.timed("qt.table_fill")
+    def show_measures(self, all_data):
+        for period, data in all_data.items():
             i = 0
             for value in data:
                 item = QTableWidgetItem(str(value.__format__("0.6f")))
@@ -79,12 +171,12 @@ class MainWindow(QMainWindow):
                 i += 1
 
     def setup_distribution_page(self):
-        self.ui.pushButtonBackToMain3.clicked.connect(lambda: self.ui.stackedWidget.setCurrentIndex(0))
+        self.ui.pushButtonBackToMain3.clicked.connect(lambda: self.show_page(MAIN_PAGE))
 
         today = date.today() - timedelta(days=29)
         self.ui.dateEdit.setDate(QDate(today.year, today.month, today.day))
-        self.ui.comboBoxDistribution1.addItems(["EUR", "USD", "GBP", "JPY", "CHF"])
-        self.ui.comboBoxDistribution2.addItems(["EUR", "USD", "GBP", "JPY", "CHF"])
+        self.ui.comboBoxDistribution1.addItems(OFFERED_CURRENCIES)
+        self.ui.comboBoxDistribution2.addItems(OFFERED_CURRENCIES)
         self.ui.comboBoxDistribution2.setCurrentIndex(1)
         self.ui.comboBoxDistribution1.setCurrentIndex(0)
 
@@ -98,43 +190,93 @@ class MainWindow(QMainWindow):
         self.ui.pushButtonQuarter.setCheckable(True)
         self.ui.pushButtonQuarter.setChecked(False)
 
-        hist, bins = get_changes_distribution(
-            self.ui.comboBoxDistribution1.currentText(),
-            self.ui.comboBoxDistribution2.currentText(),
-            self.ui.dateEdit.date().toPython(),
-            AnalysisPeriod.MONTH)
-
-        self.canvas = MplCanvas(hist, bins)
+        from app.canvas import MplCanvas  # matplotlib is loaded only with this page
+        self.canvas = MplCanvas()
 
         self.ui.verticalLayout_4.replaceWidget(self.ui.widgetDistribution, self.canvas)
         self.ui.widgetDistribution.deleteLater()
 
+        self.distribution_runner = RequestRunner(self)
+        self.distribution_runner.finished.connect(self.on_distribution_loaded)
+        self.distribution_runner.failed.connect(self.show_error)
+
         self.buttonGroup.buttonClicked.connect(self.on_update_distribution)
         self.ui.comboBoxDistribution1.currentIndexChanged.connect(self.on_update_distribution)
         self.ui.comboBoxDistribution2.currentIndexChanged.connect(self.on_update_distribution)
         self.ui.dateEdit.dateChanged.connect(self.on_update_distribution)
 
+        # typed dates and scrolled currencies are loaded only once the input settles
+        self.distribution_scheduler = UpdateScheduler(self.load_distribution, parent=self)
+        self.on_update_distribution()
+        self.distribution_scheduler.flush()
+
     def on_update_distribution(self):
-        hist, bins = get_changes_distribution(
-            self.ui.comboBoxDistribution1.currentText(),
-            self.ui.comboBoxDistribution2.currentText(),
-            self.ui.dateEdit.date().toPython(),
-            AnalysisPeriod.MONTH if self.ui.pushButtonMonth.isChecked() else AnalysisPeriod.QUARTER)
-
-        self.canvas.plot_data(hist, bins)
-
-
-class MplCanvas(FigureCanvas):
-    def __init__(self, hist, bins):
-        self.fig = Figure()
-        self.ax = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-        self.plot_data(hist, bins)
-
-    def plot_data(self, hist, bins):
-        self.ax.clear()
-        self.ax.hist(bins[:-1], bins, weights=hist, edgecolor='black')
-        self.draw()
+        period = AnalysisPeriod.MONTH if self.ui.pushButtonMonth.isChecked() else AnalysisPeriod.QUARTER
+        try:
+            self.distribution_window = call_live("get_distribution_window", self.ui.dateEdit.date().toPython(), period)
+        except ValueError as e:
+            self.distribution_window = None
+            self.distribution_scheduler.cancel()
+            self.show_error(str(e))
+            return
+
+        # moving the start date within the loaded range is served from memory, without a network round trip
+        if self.show_distribution():
+            self.distribution_scheduler.cancel()
+        else:
+            self.distribution_scheduler.schedule()
+
+    def load_distribution(self):
+        if self.distribution_window is None or self.show_distribution():
+            return
+        currencies = (self.ui.comboBoxDistribution1.currentText(), self.ui.comboBoxDistribution2.currentText())
+        self.distribution_runner.submit(call_live, "load_pair_changes", *currencies, *self.distribution_window)
+
+    def on_distribution_loaded(self, pair_changes):
+        self.pair_changes[(pair_changes.currency_1, pair_changes.currency_2)] = pair_changes
+        self.show_distribution()
+
+    def show_distribution(self) -> bool:
+        currencies = (self.ui.comboBoxDistribution1.currentText(), self.ui.comboBoxDistribution2.currentText())
+        pair_changes = self.pair_changes.get(currencies)
+        if pair_changes is None or not pair_changes.covers(*self.distribution_window):
+            return False
+        try:
+            hist, bins = pair_changes.histogram(*self.distribution_window)
+        except ValueError as e:
+            self.show_error(str(e))
+        else:
+            self.canvas.plot_data(hist, bins)
+        return True
+
+    def on_new_fixings(self, effective_date, fixings):
+        # after a day without successful checks the skipped tables are downloaded with the whole analysis
+        if self.sessions_analysis is not None and self.sessions_analysis.misses_tables(effective_date):
+            self.on_update_sessions()
+        elif self.sessions_analysis is not None and self.sessions_analysis.update(effective_date, fixings):
+            self.show_sessions(self.sessions_analysis.sessions_data())
+        if self.measures_analysis is not None and self.measures_analysis.misses_tables(effective_date):
+            self.on_update_measures()
+        elif self.measures_analysis is not None and self.measures_analysis.update(effective_date, fixings):
+            self.refresh_measures()
+        updated = [pair_changes.update(effective_date, fixings) for pair_changes in self.pair_changes.values()]
+        if any(updated) and self.distribution_window is not None:
+            self.show_distribution()
+
+    def show_placeholders(self, table):
+        for row in range(table.rowCount()):
+            for column in range(table.columnCount()):
+                table.setItem(row, column, QTableWidgetItem(LOADING_PLACEHOLDER))
+
+    def show_diagnostics(self):
+        if self.diagnostics_dialog is None:
+            from app.diagnostics import DiagnosticsDialog
+            self.diagnostics_dialog = DiagnosticsDialog(self)
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
+
+    def show_error(self, message):
+        self.ui.statusbar.showMessage("Error: " + message, 5000)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+# You can run local stand-in of the NBP API from the root directory of the project by running
+# `python -m app.mock_server --fixtures benchmarks/fixtures` and point the app at it with NBP_API_URL variable
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .constans import NBP_MAX_DAYS, NBP_TABLE
+from .data_sources import DataSource, FixtureSource
+
+RATES_PATH = re.compile(r"^/api/exchangerates/rates/(?P<table>\w)/(?P<code>[^/]*)/(?P<start>[^/]+)/(?P<end>[^/]+)/?$")
+TABLES_PATH = re.compile(r"^/api/exchangerates/tables/(?P<table>\w)/(?P<start>[^/]+)/(?P<end>[^/]+)/?$")
+LAST_TABLE_PATH = re.compile(r"^/api/exchangerates/tables/(?P<table>\w)/last/?$")
+
+
+class MockNbpHandler(BaseHTTPRequestHandler):
+    server: "MockNbpServer"
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.request_count += 1
+        time.sleep(self.server.latency + self.server.random.uniform(0, self.server.jitter))
+        if self.server.random.random() < self.server.error_rate:
+            return self._send(503, "503 Service Unavailable")
+
+        path = self.path.split("?")[0]
+        match = LAST_TABLE_PATH.match(path)
+        if match is not None and match['table'].upper() == NBP_TABLE:
+            return self._send_tables(self.server.source.fetch_last_table())
+
+        match = RATES_PATH.match(path) or TABLES_PATH.match(path)
+        if match is None or match['table'].upper() != NBP_TABLE:
+            return self._send(404, "404 NotFound")
+        try:
+            date_start = date.fromisoformat(match['start'])
+            date_end = date.fromisoformat(match['end'])
+        except ValueError:
+            return self._send(400, "400 BadRequest - Błędny zakres dat / Invalid date range")
+        if date_start > date_end or (date_end - date_start).days >= NBP_MAX_DAYS:
+            return self._send(400, "400 BadRequest - Przekroczony limit 93 dni / Limit of 93 days has been exceeded")
+
+        if 'code' in match.groupdict():
+            rates = self.server.source.fetch_rates([(match['code'], date_start, date_end)])[0]
+            if rates is None:
+                return self._send(404, "404 NotFound - Not Found - Brak danych")
+            return self._send(200, {'table': NBP_TABLE, 'code': match['code'].upper(), 'rates': rates})
+
+        return self._send_tables(self.server.source.fetch_table_rates(date_start, date_end))
+
+    def _send_tables(self, all_rates: dict[str, list[dict]]):
+        tables = {}
+        for code, rates in all_rates.items():
+            for rate in rates:
+                tables.setdefault(rate['effectiveDate'], []).append({'code': code, 'mid': rate['mid']})
+        if not tables:
+            return self._send(404, "404 NotFound - Not Found - Brak danych")
+        return self._send(200, [
+            {'table': NBP_TABLE, 'effectiveDate': day, 'rates': tables[day]} for day in sorted(tables)
+        ])
+
+    def _send(self, status: int, body):
+        content = json.dumps(body).encode() if status == 200 else body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json" if status == 200 else "text/plain")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class MockNbpServer(ThreadingHTTPServer):
+    """
+    Local HTTP stand-in of the NBP API serving rates of a data source, with configurable latency and errors.
+    """
+    daemon_threads = True
+
+    def __init__(
+            self, source: DataSource, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+            jitter: float = 0.0, error_rate: float = 0.0, seed: int | None = None, verbose: bool = False
+    ):
+        """
+        Args:
+            source (DataSource): Source of the served rates.
+            host (str): Address to listen on.
+            port (int): Port to listen on, 0 for any free port.
+            latency (float): Delay in seconds before every response.
+            jitter (float): Maximal random delay in seconds added to the latency.
+            error_rate (float): Fraction of requests answered with 503 Service Unavailable.
+            seed (int | None): Seed of the random generator of jitter and errors.
+            verbose (bool): Log every request to stderr.
+        """
+        super().__init__((host, port), MockNbpHandler)
+        self.source = source
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.verbose = verbose
+        self.request_count = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "MockNbpServer":
+        """
+        Serves requests in a background thread.
+
+        Returns:
+            MockNbpServer: The server itself.
+        """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Local stand-in of the NBP API serving recorded responses.")
+    parser.add_argument("--fixtures", required=True, help="directory with NBP responses saved as JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="delay of every response in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="maximal random delay added to latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with 503")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    server = MockNbpServer(
+        FixtureSource.from_directory(args.fixtures), args.host, args.port, args.latency, args.jitter,
+        args.error_rate, args.seed, verbose=True
+    )
+    print(f"Serving NBP API stand-in at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import os
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+DEFAULT_STORE_PATH = Path.home() / ".currency_analysis" / "rates.sqlite3"
+
+
+class RateStore:
+    """
+    On-disk store of NBP mid rates keyed by table, currency code and effective date.
+
+    Besides the rates themselves the store remembers which date ranges were already downloaded, so
+    days without a fixing (weekends, holidays) are not requested again. Published rates for past days
+    never change, therefore only ranges ending before today are remembered as complete.
+    """
+
+    def __init__(self, path: str | os.PathLike = DEFAULT_STORE_PATH):
+        """
+        Args:
+            path (str | PathLike): Location of the SQLite database file, ":memory:" for a temporary store.
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS rates ("
+                "tab TEXT NOT NULL, code TEXT NOT NULL, effective_date TEXT NOT NULL, mid REAL NOT NULL, "
+                "PRIMARY KEY (tab, code, effective_date))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS fetched_ranges ("
+                "tab TEXT NOT NULL, code TEXT NOT NULL, start_date TEXT NOT NULL, end_date TEXT NOT NULL)"
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def has_currency(self, table: str, currency: str) -> bool:
+        """
+        Args:
+            table (str): NBP table letter.
+            currency (str): The currency code.
+
+        Returns:
+            bool: True if any range of the currency was downloaded successfully before.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM fetched_ranges WHERE tab = ? AND code = ? LIMIT 1",
+                (table.upper(), currency.upper())
+            ).fetchone()
+        return row is not None
+
+    def missing_ranges(
+            self, table: str, currency: str, date_start: date, date_end: date
+    ) -> list[tuple[date, date]]:
+        """
+        Args:
+            table (str): NBP table letter.
+            currency (str): The currency code.
+            date_start (date): First day of the requested range.
+            date_end (date): Last day of the requested range.
+
+        Returns:
+            list: Ordered list of (start, end) date ranges inside the requested range that were never downloaded.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT start_date, end_date FROM fetched_ranges "
+                "WHERE tab = ? AND code = ? AND end_date >= ? AND start_date <= ? ORDER BY start_date",
+                (table.upper(), currency.upper(), date_start.isoformat(), date_end.isoformat())
+            ).fetchall()
+
+        missing = []
+        cursor = date_start
+        for start_str, end_str in rows:
+            covered_start = date.fromisoformat(start_str)
+            covered_end = date.fromisoformat(end_str)
+            if covered_start > cursor:
+                missing.append((cursor, min(covered_start - timedelta(days=1), date_end)))
+            cursor = max(cursor, covered_end + timedelta(days=1))
+            if cursor > date_end:
+                return missing
+        missing.append((cursor, date_end))
+        return missing
+
+    def add_rates(self, table: str, currency: str, rates: list[dict], date_start: date, date_end: date):
+        """
+        Saves downloaded rates and marks their range as fetched. Today is never marked as fetched,
+        because its fixing may not be published yet.
+
+        Args:
+            table (str): NBP table letter.
+            currency (str): The currency code.
+            rates (list): Rates in the NBP format, dicts with 'effectiveDate' and 'mid' keys.
+            date_start (date): First day of the downloaded range.
+            date_end (date): Last day of the downloaded range.
+        """
+        table = table.upper()
+        currency = currency.upper()
+        covered_end = min(date_end, date.today() - timedelta(days=1))
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO rates (tab, code, effective_date, mid) VALUES (?, ?, ?, ?)",
+                [(table, currency, rate['effectiveDate'], rate['mid']) for rate in rates]
+            )
+            if covered_end >= date_start:
+                self._connection.execute(
+                    "INSERT INTO fetched_ranges (tab, code, start_date, end_date) VALUES (?, ?, ?, ?)",
+                    (table, currency, date_start.isoformat(), covered_end.isoformat())
+                )
+
+    def get_rates(self, table: str, currency: str, date_start: date, date_end: date) -> list[dict]:
+        """
+        Args:
+            table (str): NBP table letter.
+            currency (str): The currency code.
+            date_start (date): First day of the requested range.
+            date_end (date): Last day of the requested range.
+
+        Returns:
+            list: Stored rates ordered by date, dicts with 'effectiveDate' and 'mid' keys like in the NBP API.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT effective_date, mid FROM rates "
+                "WHERE tab = ? AND code = ? AND effective_date BETWEEN ? AND ? ORDER BY effective_date",
+                (table.upper(), currency.upper(), date_start.isoformat(), date_end.isoformat())
+            ).fetchall()
+        return [{'effectiveDate': effective_date, 'mid': mid} for effective_date, mid in rows]
+
+    def get_all_rates(self, table: str, date_start: date, date_end: date) -> dict[str, list[dict]]:
+        """
+        Args:
+            table (str): NBP table letter.
+            date_start (date): First day of the requested range.
+            date_end (date): Last day of the requested range.
+
+        Returns:
+            dict: Maps currency code to its stored rates ordered by date, like returned by get_rates.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT code, effective_date, mid FROM rates "
+                "WHERE tab = ? AND effective_date BETWEEN ? AND ? ORDER BY code, effective_date",
+                (table.upper(), date_start.isoformat(), date_end.isoformat())
+            ).fetchall()
+
+        all_rates = {}
+        for code, effective_date, mid in rows:
+            all_rates.setdefault(code, []).append({'effectiveDate': effective_date, 'mid': mid})
+        return all_rates
+
+
+_store: RateStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_rate_store() -> RateStore:
+    """
+    Returns:
+        RateStore: The shared store, created on first use at NBP_RATE_STORE path or the default location.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = RateStore(os.environ.get("NBP_RATE_STORE", DEFAULT_STORE_PATH))
+        return _store
+
+
+def set_rate_store(store: RateStore | None):
+    """
+    Args:
+        store (RateStore | None): Store used by the API functions, None to recreate the default one on next use.
+    """
+    global _store
+    with _store_lock:
+        _store = store
@@ -0,0 +1,200 @@
+import heapq
+import math
+from collections import Counter, deque
+
+
+class _SlidingMedian:
+    """
+    Median of a multiset supporting insertion and removal in O(log n), kept as two heaps with lazy deletion.
+    """
+
+    def __init__(self):
+        self._low = []  # max heap of the smaller half, values negated
+        self._high = []  # min heap of the larger half
+        self._low_size = 0
+        self._high_size = 0
+        self._delayed = Counter()
+
+    def _prune(self, heap: list, sign: int):
+        while heap and self._delayed[sign * heap[0]]:
+            self._delayed[sign * heap[0]] -= 1
+            heapq.heappop(heap)
+
+    def _rebalance(self):
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._low_size += 1
+            self._high_size -= 1
+            self._prune(self._high, 1)
+
+    def add(self, value: float):
+        if not self._low or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, value: float):
+        self._delayed[value] += 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            if value == -self._low[0]:
+                self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            if self._high and value == self._high[0]:
+                self._prune(self._high, 1)
+        self._rebalance()
+
+    def median(self) -> float:
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+
+class RollingStatistics:
+    """
+    Statistical measures of a sliding window of rates, updated in O(log n) per added or removed rate.
+
+    Mean and variance are kept with Welford's algorithm, the median with two heaps and the mode with
+    a counter of values and a heap of (count, value) entries. Rounding errors of removing values are
+    cleared by recomputing the mean and variance once the whole window was replaced.
+    """
+
+    def __init__(self):
+        self._values = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._median = _SlidingMedian()
+        self._counts = Counter()
+        self._mode_heap = []
+        self._pops_since_resync = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def push(self, value: float):
+        """
+        Args:
+            value (float): Rate added at the end of the window.
+        """
+        self._values.append(value)
+        delta = value - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (value - self._mean)
+
+        self._median.add(value)
+        self._counts[value] += 1
+        heapq.heappush(self._mode_heap, (-self._counts[value], value))
+
+    def pop(self) -> float:
+        """
+        Returns:
+            float: The oldest rate, removed from the window.
+        """
+        value = self._values.popleft()
+        if self._values:
+            delta = value - self._mean
+            self._mean -= delta / len(self._values)
+            self._m2 -= delta * (value - self._mean)
+        else:
+            self._mean = 0.0
+            self._m2 = 0.0
+        self._pops_since_resync += 1
+        if self._pops_since_resync >= len(self._values):
+            self._resync()
+
+        self._median.remove(value)
+        self._counts[value] -= 1
+        if self._counts[value]:
+            heapq.heappush(self._mode_heap, (-self._counts[value], value))
+        else:
+            del self._counts[value]
+        if len(self._mode_heap) > 4 * len(self._counts) + 16:
+            self._mode_heap = [(-count, element) for element, count in self._counts.items()]
+            heapq.heapify(self._mode_heap)
+        return value
+
+    def _resync(self):
+        self._pops_since_resync = 0
+        if self._values:
+            self._mean = math.fsum(self._values) / len(self._values)
+            self._m2 = math.fsum((element - self._mean) ** 2 for element in self._values)
+
+    def mode(self) -> float:
+        """
+        Returns:
+            float: The most common rate in the window, the smallest one if several are equally common.
+        """
+        while -self._mode_heap[0][0] != self._counts.get(self._mode_heap[0][1], 0):
+            heapq.heappop(self._mode_heap)
+        return self._mode_heap[0][1]
+
+    def measures(self) -> tuple[float, float, float, float]:
+        """
+        Returns:
+            tuple: Median, mode, standard deviation and coefficient of variation of the window, like
+                engine.calculate_statistical_measures. Standard deviation and coefficient of variation are
+                NaN while the window has less than two rates.
+        """
+        if len(self._values) < 2:
+            standard_deviation = math.nan
+        else:
+            standard_deviation = math.sqrt(max(self._m2, 0.0) / (len(self._values) - 1))
+
+        return self._median.median(), self.mode(), standard_deviation, standard_deviation / self._mean
+
+
+class RollingSessions:
+    """
+    Numbers of growth, decline and unchanged sessions of a sliding window of rates, updated in O(1) per added
+    or removed rate.
+    """
+
+    def __init__(self):
+        self._values = deque()
+        self._signs = deque()
+        self._runs = {1: 0, -1: 0, 0: 0}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def push(self, value: float):
+        """
+        Args:
+            value (float): Rate added at the end of the window.
+        """
+        if self._values:
+            change = value - self._values[-1]
+            sign = (change > 0) - (change < 0)
+            if not self._signs or self._signs[-1] != sign:
+                self._runs[sign] += 1
+            self._signs.append(sign)
+        self._values.append(value)
+
+    def pop(self) -> float:
+        """
+        Returns:
+            float: The oldest rate, removed from the window.
+        """
+        value = self._values.popleft()
+        if self._signs:
+            sign = self._signs.popleft()
+            if not self._signs or self._signs[0] != sign:
+                self._runs[sign] -= 1
+        return value
+
+    def sessions(self) -> tuple[int, int, int]:
+        """
+        Returns:
+            tuple: Number of growth sessions, decline sessions and unchanged sessions, like
+                engine.count_sessions.
+        """
+        return self._runs[1], self._runs[-1], self._runs[0]
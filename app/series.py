@@ -0,0 +1,164 @@
+from datetime import date
+
+import numpy as np
+
+from .engine import to_array
+
+
+class RateSeries:
+    """
+    Mid rates of one currency ordered by date, kept as a datetime64[D] array of effective dates and a float64
+    array of mid rates. Slicing by date returns views sharing memory with the original series.
+    """
+    __slots__ = ("dates", "mids")
+
+    def __init__(self, dates: np.ndarray, mids: np.ndarray):
+        """
+        Args:
+            dates (np.ndarray): Effective dates in ascending order, converted to datetime64[D].
+            mids (np.ndarray): Mid rates of the dates, converted to float64.
+        """
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.mids = np.asarray(mids, dtype=np.float64)
+        if self.dates.shape != self.mids.shape:
+            raise ValueError("Data inconsistency")
+
+    @classmethod
+    def from_rates(cls, rates: list[dict]) -> "RateSeries":
+        """
+        Args:
+            rates (list): Rates ordered by date, dicts with 'effectiveDate' and 'mid' keys.
+
+        Returns:
+            RateSeries: Series of the rates.
+        """
+        dates = np.array([rate['effectiveDate'] for rate in rates], dtype="datetime64[D]")
+        return cls(dates, to_array(rates))
+
+    def __len__(self) -> int:
+        return len(self.mids)
+
+    def __getitem__(self, index: slice) -> "RateSeries":
+        if not isinstance(index, slice):
+            raise TypeError("RateSeries can only be sliced")
+        return RateSeries(self.dates[index], self.mids[index])
+
+    def index_of(self, day: date) -> int:
+        """
+        Args:
+            day (date): Searched day.
+
+        Returns:
+            int: Index of the first rate with effective date not earlier than day.
+        """
+        return int(np.searchsorted(self.dates, np.datetime64(day, "D")))
+
+    def between(self, date_start: date, date_end: date) -> "RateSeries":
+        """
+        Args:
+            date_start (date): First day of the range.
+            date_end (date): Last day of the range.
+
+        Returns:
+            RateSeries: View of the rates in the range.
+        """
+        return self[self.index_of(date_start):int(np.searchsorted(self.dates, np.datetime64(date_end, "D"), "right"))]
+
+    def since(self, date_start: date) -> "RateSeries":
+        """
+        Args:
+            date_start (date): First day of the range.
+
+        Returns:
+            RateSeries: View of the rates not earlier than date_start.
+        """
+        return self[self.index_of(date_start):]
+
+    def date_strings(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Effective dates formatted like the NBP API, YYYY-MM-DD.
+        """
+        return np.datetime_as_string(self.dates, unit="D")
+
+    def to_rates(self) -> list[dict]:
+        """
+        Returns:
+            list: Rates ordered by date, dicts with 'effectiveDate' and 'mid' keys.
+        """
+        return [
+            {'effectiveDate': effective_date, 'mid': mid}
+            for effective_date, mid in zip(self.date_strings().tolist(), self.mids.tolist())
+        ]
+
+
+JOIN_INNER = "inner"
+JOIN_FFILL = "ffill"
+
+
+def align(series: list[RateSeries], join: str = JOIN_INNER) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merges series of several currencies on their effective dates.
+
+    Args:
+        series (list): Rates series of the currencies.
+        join (str): JOIN_INNER keeps only days with a rate of every currency, JOIN_FFILL keeps every day with
+            a rate of any currency once all of them started, filling missing rates with the last known ones.
+
+    Returns:
+        tuple: datetime64[D] array of the merged days and float64 array of shape (len(series), days) with
+            the rates of every currency on these days.
+    """
+    if join not in (JOIN_INNER, JOIN_FFILL):
+        raise ValueError("Join must be either 'inner' or 'ffill'")
+    if not series:
+        return np.empty(0, dtype="datetime64[D]"), np.empty((0, 0))
+    # series from the same NBP table usually share all their days, nothing to merge then
+    if all(np.array_equal(element.dates, series[0].dates) for element in series[1:]):
+        return series[0].dates, np.stack([element.mids for element in series])
+
+    # stable sort merges the already sorted dates of every series in linear time, unlike np.unique
+    days = np.sort(np.concatenate([element.dates for element in series]), kind="stable")
+    days = days[np.concatenate(([True], days[1:] != days[:-1]))]
+    # index of the last rate not later than every merged day, -1 before the first rate
+    indices = np.stack([np.searchsorted(element.dates, days, "right") - 1 for element in series])
+    started = (indices >= 0).all(axis=0)
+    days = days[started]
+    indices = indices[:, started]
+    if join == JOIN_INNER:
+        exact = np.ones(len(days), dtype=bool)
+        for element, element_indices in zip(series, indices):
+            exact &= element.dates[element_indices] == days
+        days = days[exact]
+        indices = indices[:, exact]
+
+    mids = np.stack([element.mids[element_indices] for element, element_indices in zip(series, indices)])
+    return days, mids
+
+
+def cross_rates(rates1: RateSeries, rates2: RateSeries, join: str = JOIN_INNER) -> RateSeries:
+    """
+    Args:
+        rates1 (RateSeries): Rates of the first currency.
+        rates2 (RateSeries): Rates of the second currency.
+        join (str): JOIN_INNER or JOIN_FFILL, see align.
+
+    Returns:
+        RateSeries: Value of the second currency in units of the first one on the merged days.
+    """
+    days, mids = align([rates1, rates2], join)
+    return RateSeries(days, mids[1] / mids[0])
+
+
+def cross_rate_matrix(series: list[RateSeries], join: str = JOIN_INNER) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Args:
+        series (list): Rates series of N currencies.
+        join (str): JOIN_INNER or JOIN_FFILL, see align.
+
+    Returns:
+        tuple: datetime64[D] array of the merged days and float64 array of shape (days, N, N), where element
+            [day, i, j] is the value of currency j in units of currency i.
+    """
+    days, mids = align(series, join)
+    return days, mids.T[:, np.newaxis, :] / mids.T[:, :, np.newaxis]
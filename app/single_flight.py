@@ -0,0 +1,77 @@
+import copy
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses identical calls made at the same time into one. A caller asking for a key that is already
+    being fetched waits for that fetch and gets its result, or its exception, instead of fetching again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn, *args):
+        """
+        Args:
+            key: Identifies the call, for example the requested url.
+            fn (callable): Function making the call, not called if a call with the same key is in flight.
+            *args: Arguments passed to fn.
+
+        Returns:
+            Result of fn, shared by all callers waiting for it, so it must not be modified. Callers waiting
+            for a failed call get a copy of its exception, chained to the original one.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                # every waiter raises its own copy, so they do not share and extend one traceback
+                raise copy.copy(call.error) from call.error
+            return call.result
+
+        try:
+            call.result = fn(*args)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Numbers of calls made, of callers served by a call of another one and of calls in flight,
+                and part of callers served by a shared call.
+        """
+        with self._lock:
+            requests_count = self.calls + self.shared
+            return {
+                'calls': self.calls,
+                'shared': self.shared,
+                'in_flight': len(self._calls),
+                'hit_rate': self.shared / requests_count if requests_count else 0.0,
+            }
@@ -0,0 +1,238 @@
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, Signal
+
+# NBP publishes table A once per working day, around noon
+DEFAULT_POLL_INTERVAL_MS = 15 * 60 * 1000
+# quiet time after the last input of a burst, like typed date digits or scrolled combo box items
+DEFAULT_DEBOUNCE_MS = 250
+DEFAULT_PREFETCH_WORKERS = 2
+
+
+class WorkerSignals(QObject):
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class Worker(QRunnable):
+    """
+    Runs a single function call on a thread pool and reports the outcome with signals.
+    """
+
+    def __init__(self, request_id: int, is_current, fn, *args):
+        """
+        Args:
+            request_id (int): Number identifying the request, sent back with the result.
+            is_current (callable): Tells whether the request is still wanted, checked before fn is called.
+            fn (callable): Function to call outside the UI thread.
+            *args: Arguments passed to fn.
+        """
+        super().__init__()
+        self.request_id = request_id
+        self.is_current = is_current
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self):
+        if not self.is_current(self.request_id):
+            return
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            self.signals.finished.emit(self.request_id, result)
+
+
+class RequestRunner(QObject):
+    """
+    Runs requests of one page in the background. Only the result of the latest request is delivered,
+    requests still waiting in the pool are skipped once a newer one is submitted.
+    """
+    started = Signal()
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, parent: QObject | None = None, thread_pool: QThreadPool | None = None):
+        """
+        Args:
+            parent (QObject | None): Qt parent of the runner.
+            thread_pool (QThreadPool | None): Pool running the requests, the global instance if not given.
+        """
+        super().__init__(parent)
+        self._thread_pool = thread_pool if thread_pool is not None else QThreadPool.globalInstance()
+        self._latest_id = 0
+
+    def submit(self, fn, *args) -> int:
+        """
+        Args:
+            fn (callable): Function fetching and computing the page data.
+            *args: Arguments passed to fn.
+
+        Returns:
+            int: Id of the submitted request.
+        """
+        self._latest_id += 1
+        worker = Worker(self._latest_id, self.is_current, fn, *args)
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.failed.connect(self._on_failed)
+
+        self.started.emit()
+        self._thread_pool.start(worker)
+        return self._latest_id
+
+    def is_current(self, request_id: int) -> bool:
+        return request_id == self._latest_id
+
+    def _on_finished(self, request_id: int, result):
+        if self.is_current(request_id):
+            self.finished.emit(result)
+
+    def _on_failed(self, request_id: int, message: str):
+        if self.is_current(request_id):
+            self.failed.emit(message)
+
+
+class UpdateScheduler(QObject):
+    """
+    Merges bursts of input signals of one page into a single update, made once the input settles. The update
+    reads the state of the page when it runs, so only the latest requested state is computed.
+    """
+
+    def __init__(self, update, delay_ms: int = DEFAULT_DEBOUNCE_MS, parent: QObject | None = None):
+        """
+        Args:
+            update (callable): Updates the page from its current input, usually by submitting a request.
+            delay_ms (int): Time without new input in milliseconds after which the update is made.
+            parent (QObject | None): Qt parent of the scheduler.
+        """
+        super().__init__(parent)
+        self._update = update
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._update)
+
+    def schedule(self, *args):
+        """
+        Postpones the update until no other schedule call comes for the delay. Arguments are ignored, so any
+        signal can be connected.
+        """
+        self._timer.start()
+
+    def is_pending(self) -> bool:
+        return self._timer.isActive()
+
+    def cancel(self):
+        self._timer.stop()
+
+    def flush(self):
+        """
+        Makes a pending update straight away.
+        """
+        if self._timer.isActive():
+            self._timer.stop()
+            self._update()
+
+
+class RatesPoller(QObject):
+    """
+    Checks for newly published fixings on a schedule in the background and announces every new table once.
+    """
+    new_fixings = Signal(object, object)
+
+    def __init__(self, fetch_last_fixings, interval_ms: int = DEFAULT_POLL_INTERVAL_MS, parent: QObject | None = None):
+        """
+        Args:
+            fetch_last_fixings (callable): Returns the effective date of the latest table, or None, and a dict
+                mapping currency codes to their mid rates in it.
+            interval_ms (int): Time between checks in milliseconds.
+            parent (QObject | None): Qt parent of the poller.
+        """
+        super().__init__(parent)
+        self._fetch_last_fixings = fetch_last_fixings
+        self._last_date = None
+        self._runner = RequestRunner(self)
+        self._runner.finished.connect(self._on_polled)
+        # failed checks, for example without network access, are retried with the next one
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.poll)
+
+    def start(self):
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def poll(self):
+        self._runner.submit(self._fetch_last_fixings)
+
+    def _on_polled(self, result):
+        effective_date, fixings = result
+        if effective_date is not None and (self._last_date is None or effective_date > self._last_date):
+            self._last_date = effective_date
+            self.new_fixings.emit(effective_date, fixings)
+
+
+class Prefetcher(QObject):
+    """
+    Warms up data the user is likely to ask for next on a separate low priority thread pool, so that page
+    requests are never queued behind it. The first failure, for example without network access, quietly
+    stops the remaining calls.
+    """
+    finished = Signal()
+
+    def __init__(self, fn, args_list: list[tuple], max_workers: int = DEFAULT_PREFETCH_WORKERS,
+                 parent: QObject | None = None):
+        """
+        Args:
+            fn (callable): Function loading the data, its result is dropped.
+            args_list (list): Tuples of arguments, fn is called once for each of them.
+            max_workers (int): Maximal number of calls running in parallel.
+            parent (QObject | None): Qt parent of the prefetcher.
+        """
+        super().__init__(parent)
+        self._fn = fn
+        self._args_list = list(args_list)
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(max_workers)
+        self._thread_pool.setThreadPriority(QThread.LowestPriority)
+        self._remaining = 0
+        self._stopped = False
+        # set by the failing thread, so calls starting before the failure is reported are skipped as well
+        self._failed = False
+        self.loaded = 0
+
+    def start(self):
+        self._remaining = len(self._args_list)
+        for request_id, args in enumerate(self._args_list):
+            worker = Worker(request_id, self._is_wanted, self._call, *args)
+            worker.signals.finished.connect(self._on_finished)
+            worker.signals.failed.connect(self._on_failed)
+            self._thread_pool.start(worker)
+
+    def _is_wanted(self, request_id: int) -> bool:
+        return not (self._stopped or self._failed)
+
+    def _call(self, *args):
+        try:
+            return self._fn(*args)
+        except Exception:
+            self._failed = True
+            raise
+
+    def stop(self):
+        if not self._stopped:
+            self._stopped = True
+            self._thread_pool.clear()
+            self.finished.emit()
+
+    def _on_finished(self, request_id: int, result):
+        self.loaded += 1
+        self._remaining -= 1
+        if self._remaining == 0 and not self._stopped:
+            self._stopped = True
+            self.finished.emit()
+
+    def _on_failed(self, request_id: int, message: str):
+        self.stop()
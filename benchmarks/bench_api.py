@@ -0,0 +1,169 @@
+# Run from the root directory of the project with `python -m benchmarks.bench_api`
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+from app.api import _calculate_changes_distribution
+from app.engine import calculate_statistical_measures, count_sessions
+from app.series import RateSeries
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+SCALES = (1, 10, 100)
+DEFAULT_TOLERANCE = 2.0
+# slowdowns smaller than this are timer noise on sub-millisecond cases
+MIN_REGRESSION_SECONDS = 0.0005
+
+
+def load_fixtures(fixtures_dir: Path = FIXTURES_DIR) -> dict[str, list[dict]]:
+    """
+    Args:
+        fixtures_dir (Path): Directory with NBP responses of /exchangerates/rates/ endpoint saved as JSON,
+            including the responses recorded in its subdirectories.
+
+    Returns:
+        dict: Maps fixture name to its rates ordered by date.
+    """
+    return {
+        path.stem: json.loads(path.read_text())['rates']
+        for path in sorted(fixtures_dir.rglob("*.json"))
+    }
+
+
+def scale_rates(rates: list[dict], factor: int) -> list[dict]:
+    """
+    Args:
+        rates (list): Rates ordered by date.
+        factor (int): How many times the series is repeated.
+
+    Returns:
+        list: The series repeated factor times on consecutive days, so every effective date stays unique.
+            Other fields of the rates, like the table number of NBP responses, are kept.
+    """
+    first_day = date.fromisoformat(rates[0]['effectiveDate'])
+    return [
+        {**rate, 'effectiveDate': (first_day + timedelta(days=index)).isoformat()}
+        for index, rate in enumerate(rates * factor)
+    ]
+
+
+def measure(fn, *args, repeat: int = 5) -> tuple[float, int]:
+    """
+    Args:
+        fn (callable): Benchmarked function.
+        *args: Arguments passed to fn.
+        repeat (int): Number of timed calls.
+
+    Returns:
+        tuple: Best time of a single call in seconds and peak memory allocated by one call in bytes.
+    """
+    tracemalloc.start()
+    fn(*args)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    best_time = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time, peak_memory
+
+
+def run_benchmarks(fixtures: dict[str, list[dict]], scales: tuple[int, ...] = SCALES) -> dict[str, dict]:
+    """
+    Args:
+        fixtures (dict): Rates series by fixture name, at least two are needed for the distribution case.
+        scales (tuple): Data size multipliers.
+
+    Returns:
+        dict: Maps case name to its rates count, time in seconds, throughput in rates per second and peak memory.
+    """
+    names = list(fixtures)
+    cases = {}
+    for factor in scales:
+        for name in names:
+            scaled = scale_rates(fixtures[name], factor)
+            cases[f"parse/{name}/x{factor}"] = (len(scaled), RateSeries.from_rates, scaled)
+            rates = RateSeries.from_rates(scaled)
+            cases[f"sessions/{name}/x{factor}"] = (len(rates), lambda r: count_sessions(r.mids), rates)
+            cases[f"measures/{name}/x{factor}"] = (
+                len(rates), lambda r: calculate_statistical_measures(r.mids), rates
+            )
+        if len(names) > 1:
+            rates1 = RateSeries.from_rates(scale_rates(fixtures[names[0]], factor))
+            rates2 = RateSeries.from_rates(scale_rates(fixtures[names[1]], factor))
+            cases[f"distribution/{names[0]}-{names[1]}/x{factor}"] = (
+                len(rates1), lambda r: _calculate_changes_distribution(*r), (rates1, rates2)
+            )
+
+    results = {}
+    for case, (count, fn, data) in cases.items():
+        seconds, peak_memory = measure(fn, data)
+        results[case] = {
+            'rates': count,
+            'seconds': seconds,
+            'rates_per_second': count / seconds if seconds else float("inf"),
+            'peak_memory_bytes': peak_memory,
+        }
+    return results
+
+
+def find_regressions(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """
+    Args:
+        results (dict): Results returned by run_benchmarks.
+        baseline (dict): Earlier results to compare with.
+        tolerance (float): Allowed slowdown factor.
+
+    Returns:
+        list: Descriptions of cases slower than tolerance times their baseline.
+    """
+    regressions = []
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        baseline_seconds = baseline[case]['seconds']
+        if result['seconds'] > max(baseline_seconds * tolerance, baseline_seconds + MIN_REGRESSION_SECONDS):
+            regressions.append(
+                f"{case}: {result['seconds'] * 1000:.3f} ms, baseline {baseline_seconds * 1000:.3f} ms"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the api.py compute paths.")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help="directory with JSON fixtures")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline results file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown factor")
+    parser.add_argument("--update-baseline", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(load_fixtures(args.fixtures))
+
+    print(f"{'case':<48} {'rates':>8} {'time [ms]':>10} {'rates/s':>12} {'peak [KiB]':>11}")
+    for case, result in results.items():
+        print(f"{case:<48} {result['rates']:>8} {result['seconds'] * 1000:>10.3f} "
+              f"{result['rates_per_second']:>12.0f} {result['peak_memory_bytes'] / 1024:>11.1f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+    regressions = find_regressions(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for regression in regressions:
+        print("Regression:", regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# Run from the root directory of the project with `python -m benchmarks.record_fixtures EUR USD`
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+from app import http_client
+from app.constans import NBP_API_URL, NBP_TABLE
+from app.data_sources import _date_chunks
+
+# kept apart from the synthetic fixtures served by FixtureSource.from_directory, which would overlap them
+RECORDED_DIR = Path(__file__).parent / "fixtures" / "recorded"
+DEFAULT_START_DATE = date(2021, 1, 4)
+DEFAULT_END_DATE = date(2023, 12, 29)
+
+
+def record_rates(currency: str, date_start: date, date_end: date) -> dict:
+    """
+    Args:
+        currency (str): Currency code.
+        date_start (date): First day of the range.
+        date_end (date): Last day of the range.
+
+    Returns:
+        dict: NBP response of the /exchangerates/rates/ endpoint for the range, unchanged except that
+            responses of ranges longer than one request are merged into a single one.
+    """
+    recorded = None
+    for chunk_start, chunk_end in _date_chunks(date_start, date_end):
+        url = f"{NBP_API_URL}/exchangerates/rates/{NBP_TABLE}/{currency}/{chunk_start}/{chunk_end}/?format=json"
+        response = http_client.get(url)
+        if response.status_code == 404:
+            continue
+        response.raise_for_status()
+        data = response.json()
+        if recorded is None:
+            recorded = data
+        else:
+            recorded['rates'].extend(data['rates'])
+    if recorded is None:
+        raise ValueError("Invalid request parameters")
+    return recorded
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Records NBP responses as benchmark fixtures.")
+    parser.add_argument("currencies", nargs="+", help="currency codes, e.g. EUR USD")
+    parser.add_argument("--start-date", type=date.fromisoformat, default=DEFAULT_START_DATE)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=DEFAULT_END_DATE)
+    parser.add_argument("--output", type=Path, default=RECORDED_DIR, help="directory the fixtures are saved to")
+    args = parser.parse_args(argv)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    for currency in args.currencies:
+        recorded = record_rates(currency.upper(), args.start_date, args.end_date)
+        path = args.output / f"nbp_{currency.lower()}_{args.start_date.year}_{args.end_date.year}.json"
+        path.write_text(json.dumps(recorded, ensure_ascii=False))
+        print(f"{path}: {len(recorded['rates'])} rates")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+import requests
+
+from app import http_client
+from app.data_sources import set_data_source
+from app.rate_store import RateStore, set_rate_store
+
+
+def run_qt_script(script: str) -> dict:
+    """
+    Runs a script in a new interpreter with the offscreen Qt platform, so that a Qt application can be
+    created for each test.
+
+    Args:
+        script (str): Python code printing its results as JSON on the last line.
+
+    Returns:
+        dict: Results printed by the script.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=Path(__file__).parent.parent, capture_output=True, text=True,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen", "NBP_RATE_STORE": ":memory:"}, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeNbp:
+    """
+    Stand-in for the NBP API serving rates from memory and recording requested urls.
+    """
+    RATES_URL = re.compile(r"/exchangerates/rates/a/(?P<code>[^/]*)/(?P<start>[\d-]+)/(?P<end>[\d-]+)", re.IGNORECASE)
+    TABLES_URL = re.compile(r"/exchangerates/tables/a/(?P<start>[\d-]+)/(?P<end>[\d-]+)", re.IGNORECASE)
+    LAST_TABLE_URL = re.compile(r"/exchangerates/tables/a/last/", re.IGNORECASE)
+
+    def __init__(self):
+        self.rates = {}
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, *args, **kwargs):
+        with self._lock:
+            self.urls.append(url)
+        if self.LAST_TABLE_URL.search(url):
+            last_date = max((rates[-1]['effectiveDate'] for rates in self.rates.values() if rates), default="")
+            return self.get_tables(last_date, last_date)
+        match = self.TABLES_URL.search(url)
+        if match is not None:
+            return self.get_tables(match['start'], match['end'])
+        match = self.RATES_URL.search(url)
+        if match is None or match['code'].upper() not in self.rates:
+            return FakeResponse(404)
+        rates = [
+            rate for rate in self.rates[match['code'].upper()]
+            if match['start'] <= rate['effectiveDate'] <= match['end']
+        ]
+        if not rates:
+            return FakeResponse(404)
+        return FakeResponse(200, {'rates': rates})
+
+    def get_tables(self, date_start, date_end):
+        tables = {}
+        for code, rates in self.rates.items():
+            for rate in rates:
+                if date_start <= rate['effectiveDate'] <= date_end:
+                    tables.setdefault(rate['effectiveDate'], []).append({'code': code, 'mid': rate['mid']})
+        if not tables:
+            return FakeResponse(404)
+        return FakeResponse(200, [{'effectiveDate': day, 'rates': tables[day]} for day in sorted(tables)])
+
+
+@pytest.fixture(autouse=True)
+def store():
+    """
+    Temporary rate store used by every test, so that no test reads or writes the store in the home directory.
+    """
+    store = RateStore(":memory:")
+    set_rate_store(store)
+    set_data_source(None)
+    yield store
+    set_data_source(None)
+    set_rate_store(None)
+    store.close()
+
+
+@pytest.fixture
+def fake_nbp(store, monkeypatch):
+    nbp = FakeNbp()
+    monkeypatch.setattr(http_client, "get", nbp.get)
+    return nbp
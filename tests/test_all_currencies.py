@@ -0,0 +1,69 @@
+from datetime import date
+
+from freezegun import freeze_time
+
+from app import api, data_sources
+from app.constans import AnalysisPeriod
+
+
+def test_date_chunks():
+    """
+    Test case for testing splitting of long ranges into chunks accepted by the NBP API.
+    """
+    assert data_sources._date_chunks(date(2024, 1, 1), date(2024, 1, 1)) == [(date(2024, 1, 1), date(2024, 1, 1))]
+
+    chunks = data_sources._date_chunks(date(2023, 5, 26), date(2024, 5, 25))
+    assert chunks[0][0] == date(2023, 5, 26)
+    assert chunks[-1][1] == date(2024, 5, 25)
+    assert all((end - start).days < 93 for start, end in chunks)
+    assert all(previous[1].toordinal() + 1 == current[0].toordinal() for previous, current in zip(chunks, chunks[1:]))
+
+
+@freeze_time("2024-05-25")
+def test_all_currencies_from_tables(fake_nbp):
+    """
+    Test case for testing that statistics of all currencies are computed from table requests.
+    """
+    fake_nbp.rates["USD"] = [
+        {'effectiveDate': "2024-05-20", 'mid': 3.92},
+        {'effectiveDate': "2024-05-21", 'mid': 3.93},
+        {'effectiveDate': "2024-05-22", 'mid': 3.91},
+    ]
+    fake_nbp.rates["EUR"] = [
+        {'effectiveDate': "2024-05-20", 'mid': 4.27},
+        {'effectiveDate': "2024-05-21", 'mid': 4.26},
+        {'effectiveDate': "2024-05-22", 'mid': 4.26},
+    ]
+
+    sessions = api.get_sessions_data_all_currencies(AnalysisPeriod.WEEK)
+    assert sessions == {"EUR": (0, 1, 1), "USD": (1, 1, 0)}
+    assert len(fake_nbp.urls) == 1
+    assert "/exchangerates/tables/A/" in fake_nbp.urls[0]
+
+    measures = api.get_statistical_measures_all_currencies(AnalysisPeriod.WEEK)
+    assert measures["EUR"][0] == 4.26
+    assert len(fake_nbp.urls) == 1  # served from the response cache
+
+    distributions = api.get_changes_distribution_all_currencies("USD", date(2024, 5, 1), AnalysisPeriod.MONTH)
+    assert list(distributions) == ["EUR"]
+    assert sum(distributions["EUR"][0]) == 2
+
+
+@freeze_time("2024-05-25")
+def test_long_ranges_are_chunked(fake_nbp):
+    """
+    Test case for testing that year long requests are split into chunks accepted by the NBP API and merged.
+    """
+    fake_nbp.rates["USD"] = [
+        {'effectiveDate': "2023-06-01", 'mid': 4.20},
+        {'effectiveDate': "2023-12-01", 'mid': 4.00},
+        {'effectiveDate': "2024-05-20", 'mid': 3.92},
+        {'effectiveDate': "2024-05-21", 'mid': 3.93},
+    ]
+
+    assert api.get_sessions_data("USD", AnalysisPeriod.YEAR) == (1, 1, 0)
+    assert len(fake_nbp.urls) == 4
+
+    fake_nbp.urls.clear()
+    assert api.get_sessions_data("USD", AnalysisPeriod.HALF_YEAR) == (1, 1, 0)
+    assert [url.split("/USD/")[1] for url in fake_nbp.urls] == ["2024-05-25/2024-05-25/?format=json"]
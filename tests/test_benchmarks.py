@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+from benchmarks.bench_api import find_regressions, load_fixtures, run_benchmarks, scale_rates
+from benchmarks.record_fixtures import record_rates
+
+
+def test_scale_rates():
+    """
+    Test case for testing that scaled series keep unique, ordered dates and the other fields of the rates.
+    """
+    rates = [
+        {'no': "097/A/NBP/2024", 'effectiveDate': "2024-05-20", 'mid': 3.92},
+        {'no': "098/A/NBP/2024", 'effectiveDate': "2024-05-21", 'mid': 3.93},
+    ]
+    scaled = scale_rates(rates, 3)
+    assert len(scaled) == 6
+    assert scaled[1]['no'] == "098/A/NBP/2024"
+    assert [rate['mid'] for rate in scaled] == [3.92, 3.93] * 3
+    assert scaled[-1]['effectiveDate'] == "2024-05-25"
+
+
+def test_run_benchmarks():
+    """
+    Test case for testing that every compute path is benchmarked on the bundled fixtures.
+    """
+    results = run_benchmarks(load_fixtures(), scales=(1,))
+    assert {case.split("/")[0] for case in results} == {"parse", "sessions", "measures", "distribution"}
+    assert all(result['seconds'] > 0 and result['peak_memory_bytes'] > 0 for result in results.values())
+
+    baseline = {case: dict(result, seconds=result['seconds'] / 100) for case, result in results.items()}
+    slow_case = max(results, key=lambda case: results[case]['seconds'])
+    baseline[slow_case]['seconds'] = 0.0
+    results[slow_case]['seconds'] = 1.0
+    assert len(find_regressions(results, baseline, tolerance=2.0)) >= 1
+    assert find_regressions(results, results, tolerance=2.0) == []
+
+
+def test_record_rates(fake_nbp):
+    """
+    Test case for testing that responses of a range longer than one NBP request are recorded as a single one.
+    """
+    fake_nbp.rates["EUR"] = [
+        {'effectiveDate': (date(2022, 1, 3) + timedelta(days=index)).isoformat(), 'mid': 4.5 + index / 1000}
+        for index in range(0, 500, 7)
+    ]
+    recorded = record_rates("EUR", date(2022, 1, 3), date(2023, 5, 31))
+    assert recorded['rates'] == fake_nbp.rates["EUR"]
+    assert len(fake_nbp.urls) == 6
@@ -0,0 +1,86 @@
+from datetime import date
+
+from freezegun import freeze_time
+
+from app import api
+from app.cache import ResponseCache
+from app.constans import AnalysisPeriod
+from app.data_sources import CachedSource, FixtureSource, set_data_source
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@freeze_time("2024-05-25")
+def test_today_entries_expire():
+    """
+    Test case for testing that only entries covering today expire.
+    """
+    clock = FakeClock()
+    cache = ResponseCache(today_ttl=60, clock=clock)
+    cache.put("past", [1], date(2024, 5, 24), 10)
+    cache.put("today", [2], date(2024, 5, 25), 10)
+
+    clock.now = 59
+    assert cache.get("today") == [2]
+    clock.now = 61
+    assert cache.get("today") is None
+    clock.now = 10 ** 9
+    assert cache.get("past") == [1]
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 1
+
+
+def test_lru_eviction():
+    """
+    Test case for testing eviction of least recently used entries above the entries and memory limits.
+    """
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.put("a", [1], date(2020, 1, 1), 10)
+    cache.put("b", [2], date(2020, 1, 1), 10)
+    cache.get("a")
+    cache.put("c", [3], date(2020, 1, 1), 10)
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+
+    cache.put("d", [4], date(2020, 1, 1), 95)
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert cache.get("d") == [4]
+    assert cache.stats()['bytes'] == 95
+
+    cache.put("e", [5], date(2020, 1, 1), 1000)
+    assert cache.get("e") is None
+
+
+class CountingSource(FixtureSource):
+    def __init__(self, rates):
+        super().__init__(rates)
+        self.fetches = 0
+
+    def fetch_rates(self, ranges):
+        self.fetches += len(ranges)
+        return super().fetch_rates(ranges)
+
+
+@freeze_time("2024-05-25")
+def test_cached_source(store):
+    """
+    Test case for testing that repeated requests are served from the cache.
+    """
+    upstream = CountingSource({"USD": [
+        {'effectiveDate': "2024-05-20", 'mid': 3.92},
+        {'effectiveDate': "2024-05-21", 'mid': 3.93},
+        {'effectiveDate': "2024-05-22", 'mid': 3.91},
+    ]})
+    source = CachedSource(upstream)
+    set_data_source(source)
+    assert api.get_sessions_data_all_periods("USD")[AnalysisPeriod.WEEK] == (1, 1, 0)
+    assert api.get_sessions_data_all_periods("USD")[AnalysisPeriod.WEEK] == (1, 1, 0)
+    assert upstream.fetches == 1
+    assert source.cache.stats()['hits'] == 1
@@ -0,0 +1,53 @@
+import pytest
+
+from tests.conftest import run_qt_script
+
+pytest.importorskip("PySide6")
+pytest.importorskip("matplotlib")
+
+CANVAS_SCRIPT = """
+import json
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from app import instrumentation
+from app.canvas import MplCanvas
+app = QApplication()
+canvas = MplCanvas()
+canvas.resize(640, 480)
+canvas.show()
+bins = np.linspace(-0.01, 0.01, 15)
+canvas.plot_data(np.arange(14), bins)
+canvas.draw()
+bars = list(canvas.bars)
+xlim = canvas.ax.get_xlim()
+
+canvas.frame_times.clear()
+instrumentation.enable()
+for shift in range(20):
+    hist = np.roll(np.arange(14) + 1, shift)
+    canvas.plot_data(hist, bins + shift * 0.0001)
+in_place = {
+    'same_bars': canvas.bars == bars,
+    'same_xlim': bool(canvas.ax.get_xlim() == xlim),
+    'heights': [bar.get_height() for bar in canvas.bars] == hist.tolist(),
+    'left': bool(abs(canvas.bars[0].get_x() - (bins[0] + 19 * 0.0001)) < 1e-12),
+    'frames': len(canvas.frame_times),
+    'blits': instrumentation.snapshot()['spans']['mpl.blit']['count'],
+    'full_draws': instrumentation.snapshot()['spans'].get('mpl.draw', {}).get('count', 0),
+}
+
+canvas.plot_data(np.arange(14), bins + 1.0)
+print(json.dumps({**in_place, 'rescaled_xlim': bool(canvas.ax.get_xlim()[0] <= 0.99 and canvas.ax.get_xlim()[1] >= 1.01)}))
+"""
+
+
+def test_bars_updated_in_place():
+    """
+    Test case for testing that new histograms move the existing bars and are blitted without rescaling
+    the axes, unless they no longer fit in them.
+    """
+    canvas = run_qt_script(CANVAS_SCRIPT)
+    assert canvas['same_bars'] and canvas['same_xlim'] and canvas['heights'] and canvas['left']
+    assert canvas['frames'] == canvas['blits'] == 20
+    assert canvas['full_draws'] == 0
+    assert canvas['rescaled_xlim']
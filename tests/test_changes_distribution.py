@@ -1,9 +1,11 @@
 from datetime import date, timedelta
 
 import pytest
+from freezegun import freeze_time
 
 from app.api import get_changes_distribution
 from app.constans import AnalysisPeriod
+from app.series import JOIN_FFILL
 
 
 def test_invalid_currency_1():
@@ -119,3 +121,49 @@ def test_valid_requests():
     assert len(hist) == 14
     assert len(bins) == 15
     assert sum(hist) <= 80  # in last 110 days there are at least 30 weekend's days
+
+
+def test_concurrent_fetching(fake_nbp):
+    """
+    Test case for testing that both currencies and all date chunks are fetched and joined by date.
+    """
+    fake_nbp.rates["EUR"] = [
+        {'effectiveDate': "2023-09-11", 'mid': 4.60},
+        {'effectiveDate': "2023-09-12", 'mid': 4.62},
+        {'effectiveDate': "2023-12-20", 'mid': 4.35},
+    ]
+    fake_nbp.rates["USD"] = [
+        {'effectiveDate': "2023-09-11", 'mid': 4.30},
+        {'effectiveDate': "2023-09-12", 'mid': 4.28},
+        {'effectiveDate': "2023-12-20", 'mid': 3.95},
+    ]
+
+    hist, bins = get_changes_distribution("EUR", "USD", date(2023, 9, 9), AnalysisPeriod.QUARTER)
+    assert len(fake_nbp.urls) == 4
+    assert sum(hist) == 2
+    assert round(bins[0], 4) == round(3.95 / 4.35 - 4.28 / 4.62, 4)
+
+
+@freeze_time("2024-01-05")
+def test_missing_dates(fake_nbp):
+    """
+    Test case for testing that days with a rate of only one currency are skipped or forward filled.
+    """
+    fake_nbp.rates["EUR"] = [
+        {'effectiveDate': "2023-12-01", 'mid': 4.0},
+        {'effectiveDate': "2023-12-04", 'mid': 4.4},
+        {'effectiveDate': "2023-12-05", 'mid': 4.2},
+    ]
+    fake_nbp.rates["USD"] = [
+        {'effectiveDate': "2023-12-01", 'mid': 2.0},
+        {'effectiveDate': "2023-12-05", 'mid': 2.1},
+    ]
+
+    hist, bins = get_changes_distribution("EUR", "USD", date(2023, 12, 1), AnalysisPeriod.MONTH)
+    assert sum(hist) == 1
+    assert bins[0] + bins[-1] == pytest.approx(0.0)  # the only change, 0.5 to 0.5, is in the middle
+
+    hist, bins = get_changes_distribution("EUR", "USD", date(2023, 12, 1), AnalysisPeriod.MONTH, JOIN_FFILL)
+    assert sum(hist) == 2
+    assert bins[0] == pytest.approx(2.0 / 4.4 - 0.5)
+    assert bins[-1] == pytest.approx(2.1 / 4.2 - 2.0 / 4.4)
@@ -0,0 +1,97 @@
+import csv
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from freezegun import freeze_time
+
+from app import cli
+from app.data_sources import FixtureSource, set_data_source
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@pytest.fixture
+def fixtures(store):
+    set_data_source(FixtureSource.from_directory(FIXTURES_DIR))
+
+
+@freeze_time("2023-12-29")
+def test_measures_csv(fixtures, tmp_path, capsys):
+    """
+    Test case for testing batch statistical measures written as CSV, with failed currencies reported.
+    """
+    output = tmp_path / "measures.csv"
+    code = cli.main(["measures", "--currencies", "eur", "USD", "ASD", "--periods", "week", "YEAR",
+                     "--output", str(output)])
+    assert code == 1
+    assert capsys.readouterr().err == "Error: ASD: Invalid request parameters\n"
+
+    rows = list(csv.DictReader(output.open()))
+    assert [(row['currency'], row['period']) for row in rows] == [
+        ("EUR", "WEEK"), ("EUR", "YEAR"), ("USD", "WEEK"), ("USD", "YEAR")
+    ]
+    assert list(rows[0]) == cli.MEASURES_COLUMNS
+
+
+@freeze_time("2023-12-29")
+def test_sessions_and_distribution_json(fixtures, capsys):
+    """
+    Test case for testing batch sessions and distributions written as JSON to the standard output.
+    """
+    assert cli.main(["sessions", "--currencies", "EUR", "--format", "json"]) == 0
+    sessions = json.loads(capsys.readouterr().out)
+    assert len(sessions) == 6
+    assert all(sum(row[column] for column in cli.SESSIONS_COLUMNS[2:]) > 0 for row in sessions)
+
+    assert cli.main(["distribution", "--pairs", "EUR/USD", "--start-date", "2023-06-01",
+                     "--periods", "MONTH", "QUARTER", "--format", "json"]) == 0
+    distribution = json.loads(capsys.readouterr().out)
+    assert {row['period'] for row in distribution} == {"MONTH", "QUARTER"}
+    assert all(row['bin_start'] < row['bin_end'] for row in distribution)
+
+
+@freeze_time("2023-12-29")
+def test_custom_ranges(fixtures, capsys):
+    """
+    Test case for testing batch analyses of custom date ranges.
+    """
+    assert cli.main(["measures", "--currencies", "EUR", "--range", "2021-01-04", "2023-12-29",
+                     "--range", "2022-01-01", "2022-12-31", "--format", "json"]) == 0
+    measures = json.loads(capsys.readouterr().out)
+    assert [row['period'] for row in measures] == ["2021-01-04/2023-12-29", "2022-01-01/2022-12-31"]
+
+    assert cli.main(["distribution", "--pairs", "EUR/USD", "--range", "2021-01-04", "2023-12-29"]) == 0
+    distribution = list(csv.DictReader(capsys.readouterr().out.splitlines()))
+    assert sum(int(row['count']) for row in distribution) == 779
+
+    assert cli.main(["measures", "--currencies", "EUR", "--range", "1999-01-04", "2000-12-29"]) == 1
+    assert capsys.readouterr().err == "Error: EUR 1999-01-04/2000-12-29: Invalid request parameters\n"
+    assert cli.main(["distribution", "--pairs", "EUR/ASD", "--start-date", "2023-06-01", "--periods", "MONTH"]) == 1
+    assert capsys.readouterr().err == "Error: EUR/ASD MONTH: Invalid request parameters\n"
+
+
+def test_invalid_arguments():
+    """
+    Test case for testing rejected command line arguments.
+    """
+    with pytest.raises(SystemExit):
+        cli.main(["distribution", "--pairs", "EURUSD", "--start-date", "2023-06-01"])
+    with pytest.raises(SystemExit):
+        cli.main(["sessions", "--currencies", "EUR", "--periods", "DECADE"])
+    with pytest.raises(SystemExit):
+        cli.main(["distribution", "--pairs", "EUR/USD", "--start-date", "2023-06-01", "--periods", "WEEK"])
+
+
+def test_no_gui_imports():
+    """
+    Test case for testing that the command line runner does not import Qt or matplotlib.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, app.cli; print(sorted(m for m in sys.modules if m.split('.')[0] in "
+                               "('PySide6', 'matplotlib')))"],
+        cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,80 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+import requests
+from freezegun import freeze_time
+
+from app import api, http_client
+from app.constans import AnalysisPeriod
+from app.data_sources import FixtureSource, NbpHttpSource, StoreSource, set_data_source
+from app.mock_server import MockNbpServer
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@pytest.fixture
+def fixtures():
+    return FixtureSource.from_directory(FIXTURES_DIR)
+
+
+@pytest.fixture
+def mock_server(fixtures):
+    server = MockNbpServer(fixtures).start()
+    yield server
+    server.stop()
+    set_data_source(None)
+    http_client.configure(retries=http_client.DEFAULT_RETRIES, backoff_factor=http_client.DEFAULT_BACKOFF_FACTOR)
+
+
+def test_fixture_source(fixtures):
+    """
+    Test case for testing rates served from fixtures.
+    """
+    eur, unknown, weekend = fixtures.fetch_rates([
+        ("eur", date(2023, 12, 1), date(2023, 12, 31)),
+        ("ASD", date(2023, 12, 1), date(2023, 12, 31)),
+        ("USD", date(2023, 12, 2), date(2023, 12, 3)),
+    ])
+    assert len(eur) == 21
+    assert eur[0]['effectiveDate'] == "2023-12-01"
+    assert unknown is None
+    assert weekend is None
+    assert set(fixtures.fetch_table_rates(date(2023, 12, 1), date(2023, 12, 31))) == {"EUR", "USD"}
+
+
+@freeze_time("2023-12-29")
+def test_mock_server(fixtures, mock_server, store):
+    """
+    Test case for testing that the API functions give the same results through the local stand-in of the NBP API.
+    """
+    set_data_source(fixtures)
+    expected_sessions = api.get_sessions_data("EUR", AnalysisPeriod.YEAR)
+    expected_measures = api.get_statistical_measures_all_currencies(AnalysisPeriod.QUARTER)
+    expected_distribution = api.get_changes_distribution("EUR", "USD", date(2023, 6, 1), AnalysisPeriod.QUARTER)
+
+    set_data_source(StoreSource(NbpHttpSource(mock_server.url)))
+    assert api.get_sessions_data("EUR", AnalysisPeriod.YEAR) == expected_sessions
+    assert api.get_statistical_measures_all_currencies(AnalysisPeriod.QUARTER) == expected_measures
+    hist, bins = api.get_changes_distribution("EUR", "USD", date(2023, 6, 1), AnalysisPeriod.QUARTER)
+    assert list(hist) == list(expected_distribution[0])
+    assert list(bins) == list(expected_distribution[1])
+
+    with pytest.raises(ValueError) as e:
+        api.get_sessions_data("ASD", AnalysisPeriod.MONTH)
+    assert str(e.value) == "Invalid request parameters"
+
+
+def test_mock_server_errors(mock_server):
+    """
+    Test case for testing that injected server errors are retried and reported as HTTP errors, not as invalid
+    requests.
+    """
+    http_client.configure(retries=2, backoff_factor=0)
+    mock_server.error_rate = 1.0
+    set_data_source(NbpHttpSource(mock_server.url))
+
+    with pytest.raises(requests.HTTPError) as e:
+        api.get_sessions_data("EUR", AnalysisPeriod.WEEK)
+    assert e.value.response.status_code == 503
+    assert mock_server.request_count == 3
@@ -0,0 +1,77 @@
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from freezegun import freeze_time
+
+from app import api
+from app.constans import AnalysisPeriod
+from app.engine import count_sessions
+
+
+def decade_of_rates(seed: int) -> list[dict]:
+    generator = random.Random(seed)
+    rates = []
+    day = date(2013, 1, 1)
+    mid = 4.0
+    while day <= date(2024, 1, 5):
+        if day.weekday() < 5:
+            mid = round(mid + generator.choice((-0.01, 0.0, 0.01)), 4)
+            rates.append({'effectiveDate': day.isoformat(), 'mid': mid})
+        day += timedelta(days=1)
+    return rates
+
+
+@pytest.fixture
+def decade(fake_nbp):
+    fake_nbp.rates["EUR"] = decade_of_rates(1)
+    fake_nbp.rates["USD"] = decade_of_rates(2)
+    return fake_nbp
+
+
+@freeze_time("2024-01-05")
+def test_decade_range(decade):
+    """
+    Test case for testing analyses of a range of more than ten years, fetched in chunks.
+    """
+    mids = [rate['mid'] for rate in decade.rates["EUR"] if "2013-01-01" <= rate['effectiveDate'] <= "2023-12-31"]
+
+    sessions = api.get_sessions_data_for_range("EUR", date(2013, 1, 1), date(2023, 12, 31))
+    assert sessions == count_sessions(np.array(mids))
+    assert len(decade.urls) == 44  # 4017 days in chunks of at most 93 days
+
+    measures = api.get_statistical_measures_for_range("EUR", date(2013, 1, 1), date(2023, 12, 31))
+    assert measures[0] == pytest.approx(sorted(mids)[len(mids) // 2], abs=0.01)
+    assert len(decade.urls) == 44
+
+    hist, bins = api.get_changes_distribution_for_range("EUR", "USD", date(2013, 1, 1), date(2023, 12, 31))
+    assert sum(hist) == len(mids) - 1
+
+
+@freeze_time("2024-01-05")
+def test_periods_match_ranges(decade):
+    """
+    Test case for testing that the analysis periods are the ranges ending today.
+    """
+    assert api.get_sessions_data("USD", AnalysisPeriod.QUARTER) == api.get_sessions_data_for_range(
+        "USD", date(2023, 10, 8), date(2024, 1, 5)
+    )
+    assert api.get_statistical_measures("USD", AnalysisPeriod.YEAR) == api.get_statistical_measures_for_range(
+        "USD", date(2023, 1, 6), date(2030, 1, 1)
+    )
+
+
+@freeze_time("2024-01-05")
+@pytest.mark.parametrize("date_start, date_end", [
+    (date(2001, 12, 31), date(2002, 6, 1)),
+    (date(2020, 6, 1), date(2020, 5, 1)),
+    (date(2024, 1, 6), date(2024, 2, 1)),
+])
+def test_invalid_ranges(date_start, date_end):
+    """
+    Test case for testing ranges rejected before anything is downloaded.
+    """
+    with pytest.raises(ValueError) as e:
+        api.get_sessions_data_for_range("EUR", date_start, date_end)
+    assert str(e.value) == "Invalid request parameters"
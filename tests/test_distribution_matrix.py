@@ -0,0 +1,66 @@
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from freezegun import freeze_time
+
+from app import api
+from app.constans import AnalysisPeriod
+
+CURRENCIES = ["EUR", "USD", "GBP", "CHF"]
+
+
+@pytest.fixture
+def currencies(fake_nbp):
+    generator = random.Random(3)
+    for currency in CURRENCIES:
+        mid = generator.uniform(3.5, 5.5)
+        rates = []
+        day = date(2023, 6, 1)
+        while day <= date(2023, 12, 29):
+            if day.weekday() < 5:
+                mid = round(mid * generator.uniform(0.99, 1.01), 4)
+                rates.append({'effectiveDate': day.isoformat(), 'mid': mid})
+            day += timedelta(days=1)
+        fake_nbp.rates[currency] = rates
+    return fake_nbp
+
+
+@freeze_time("2023-12-29")
+def test_matrix_matches_pairs(currencies):
+    """
+    Test case for testing that every pair of the matrix equals its histogram computed alone, from one
+    download of every currency.
+    """
+    codes, hist, bins = api.get_changes_distribution_matrix(CURRENCIES, date(2023, 7, 3), AnalysisPeriod.QUARTER)
+    assert codes == CURRENCIES
+    assert hist.shape == (4, 4, 14)
+    assert bins.shape == (4, 4, 15)
+    assert len(currencies.urls) == 4 * 2  # 121 days are two chunks
+
+    for i, currency_1 in enumerate(CURRENCIES):
+        assert hist[i, i].sum() == 0
+        assert np.isnan(bins[i, i]).all()
+        for j, currency_2 in enumerate(CURRENCIES):
+            if i != j:
+                expected_hist, expected_bins = api.get_changes_distribution(
+                    currency_1, currency_2, date(2023, 7, 3), AnalysisPeriod.QUARTER
+                )
+                assert hist[i, j].tolist() == list(expected_hist)
+                assert bins[i, j].tolist() == pytest.approx(list(expected_bins))
+
+
+@freeze_time("2023-12-29")
+def test_shared_bins_and_all_currencies(currencies):
+    """
+    Test case for testing shared bins boundaries and the matrix of all currencies in the NBP table.
+    """
+    codes, hist, bins = api.get_changes_distribution_matrix(
+        None, date(2023, 7, 3), AnalysisPeriod.MONTH, shared_bins=True
+    )
+    assert codes == sorted(CURRENCIES)
+    pairs = ~np.eye(4, dtype=bool)
+    assert (bins[pairs] == bins[0, 1]).all()
+    assert (hist[pairs].sum(axis=1) == hist[0, 1].sum()).all()
+    assert "/exchangerates/tables/A/" in currencies.urls[0]
@@ -0,0 +1,79 @@
+import statistics
+
+import numpy as np
+import pytest
+
+from app.engine import calculate_statistical_measures, column_histograms, count_sessions
+
+
+def reference_sessions(mid_values):
+    rising_sessions = falling_sessions = no_changes = 0
+    status_flag = -2
+    for previous, current in zip(mid_values, mid_values[1:]):
+        flag = 1 if current > previous else -1 if current < previous else 0
+        if flag != status_flag:
+            status_flag = flag
+            if flag == -1:
+                falling_sessions += 1
+            elif flag == 1:
+                rising_sessions += 1
+            else:
+                no_changes += 1
+    return rising_sessions, falling_sessions, no_changes
+
+
+def reference_measures(mid_values):
+    mid_values = sorted(mid_values)
+    standard_deviation = statistics.stdev(mid_values)
+    return (statistics.median(mid_values), statistics.mode(mid_values), standard_deviation,
+            standard_deviation / statistics.mean(mid_values))
+
+
+def test_count_sessions():
+    """
+    Test case for testing session counting against the loop based implementation.
+    """
+    assert count_sessions(np.array([])) == (0, 0, 0)
+    assert count_sessions(np.array([4.2])) == (0, 0, 0)
+    assert count_sessions(np.array([4.2, 4.3, 4.4, 4.4, 4.4, 4.1, 4.2])) == (2, 1, 1)
+
+    generator = np.random.default_rng(2024)
+    for _ in range(20):
+        mid_values = np.round(4 + generator.normal(0, 0.01, 300).cumsum(), 2)
+        assert count_sessions(mid_values) == reference_sessions(mid_values.tolist())
+
+
+def test_calculate_statistical_measures():
+    """
+    Test case for testing statistical measures against the statistics module.
+    """
+    generator = np.random.default_rng(2024)
+    for size in (2, 3, 10, 365):
+        mid_values = np.round(4 + generator.normal(0, 0.05, size), 3)
+        result = calculate_statistical_measures(mid_values)
+        expected = reference_measures(mid_values.tolist())
+        assert result[0] == expected[0]
+        assert result[1] == expected[1]
+        assert result[2] == pytest.approx(expected[2], rel=1e-12)
+        assert result[3] == pytest.approx(expected[3], rel=1e-12)
+
+    with pytest.raises(statistics.StatisticsError):
+        calculate_statistical_measures(np.array([4.2]))
+
+
+def test_column_histograms():
+    """
+    Test case for testing that histograms of all columns are equal to histograms of every column.
+    """
+    values = np.random.default_rng(7).normal(size=(300, 5))
+    values[:, 2] = 0.25
+
+    hist, bins = column_histograms(values, 14)
+    for column in range(5):
+        expected_hist, expected_bins = np.histogram(values[:, column], bins=14)
+        assert hist[column].tolist() == expected_hist.tolist()
+        assert bins[column].tolist() == expected_bins.tolist()
+
+    hist, bins = column_histograms(values, 14, shared_edges=True)
+    assert (bins == bins[0]).all()
+    assert hist.sum(axis=1).tolist() == [300] * 5
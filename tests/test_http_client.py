@@ -0,0 +1,74 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from app import http_client
+
+
+@pytest.fixture
+def server():
+    statuses = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = statuses.pop(0) if statuses else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}", statuses
+    httpd.shutdown()
+    httpd.server_close()
+    http_client.configure(
+        timeout=http_client.DEFAULT_TIMEOUT,
+        retries=http_client.DEFAULT_RETRIES,
+        backoff_factor=http_client.DEFAULT_BACKOFF_FACTOR
+    )
+
+
+def test_retry_on_server_errors(server):
+    """
+    Test case for testing that 429 and 5xx responses are retried.
+    """
+    url, statuses = server
+    http_client.configure(backoff_factor=0)
+
+    statuses.extend([503, 429])
+    assert http_client.get(url).status_code == 200
+
+    statuses.extend([500, 500, 500, 500])
+    assert http_client.get(url).status_code == 500
+
+
+def test_no_retry_on_client_errors(server):
+    """
+    Test case for testing that 404 responses are returned straight away.
+    """
+    url, statuses = server
+    http_client.configure(backoff_factor=0)
+
+    statuses.extend([404, 200])
+    assert http_client.get(url).status_code == 404
+    assert statuses == [200]
+
+
+def test_shared_session():
+    """
+    Test case for testing that the session is reused until the client is configured again.
+    """
+    session = http_client.get_session()
+    assert http_client.get_session() is session
+
+    http_client.configure(timeout=1)
+    assert http_client.get_session() is not session
+    assert isinstance(http_client.get_session(), requests.Session)
+    http_client.configure(timeout=http_client.DEFAULT_TIMEOUT)
@@ -0,0 +1,97 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+from freezegun import freeze_time
+
+from app import api, cli, instrumentation
+from app.constans import AnalysisPeriod
+from app.data_sources import FixtureSource, set_data_source
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def recording():
+    enabled = instrumentation.is_enabled()
+    instrumentation.reset()
+    yield
+    instrumentation.enable(enabled)
+    instrumentation.reset()
+
+
+def test_spans_and_counters():
+    """
+    Test case for testing that spans and counters are recorded only while recording is on.
+    """
+    instrumentation.enable(False)
+    with instrumentation.span("work"):
+        instrumentation.count("calls")
+    assert instrumentation.snapshot()['spans'] == {}
+    assert instrumentation.snapshot()['counters'] == {}
+
+    instrumentation.enable()
+    for _ in range(3):
+        with instrumentation.span("work"):
+            instrumentation.count("calls", 2)
+    with pytest.raises(ValueError):
+        with instrumentation.span("work"):
+            raise ValueError()
+
+    snapshot = instrumentation.snapshot()
+    stats = snapshot['spans']['work']
+    assert stats['count'] == 4
+    assert stats['min'] <= stats['mean'] <= stats['max']
+    assert stats['total'] == pytest.approx(stats['mean'] * 4)
+    assert snapshot['counters'] == {'calls': 6}
+    assert [event['failed'] for event in snapshot['events']] == [False, False, False, True]
+
+
+def test_timed():
+    """
+    Test case for testing that the decorator records calls and keeps the result of the function.
+    """
+    @instrumentation.timed("double")
+    def double(value):
+        return value * 2
+
+    assert double(2) == 4
+    instrumentation.enable()
+    assert double(3) == 6
+    assert instrumentation.snapshot()['spans']['double']['count'] == 1
+
+
+def test_http_requests_and_cache_hit_rate(fake_nbp):
+    """
+    Test case for testing counted NBP requests and hit rate of the response cache reported in the snapshot.
+    """
+    fake_nbp.rates['EUR'] = [
+        {'effectiveDate': '2023-01-02', 'mid': 4.6},
+        {'effectiveDate': '2023-01-03', 'mid': 4.7},
+        {'effectiveDate': '2023-01-04', 'mid': 4.65},
+    ]
+    instrumentation.enable()
+    api.get_sessions_data_for_range("EUR", date(2023, 1, 2), date(2023, 1, 4))
+    api.get_sessions_data_for_range("EUR", date(2023, 1, 2), date(2023, 1, 4))
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot['counters']['http.requests'] == len(fake_nbp.urls) == 1
+    assert {'http.wait', 'http.json_decode', 'data.fetch', 'compute.sessions'} <= set(snapshot['spans'])
+    assert snapshot['gauges']['response_cache']['hit_rate'] == 0.5
+
+
+@freeze_time("2023-12-29")
+def test_cli_diagnostics(store, tmp_path):
+    """
+    Test case for testing timings exported as JSON by the command line.
+    """
+    set_data_source(FixtureSource.from_directory(FIXTURES_DIR))
+    output = tmp_path / "diagnostics.json"
+    code = cli.main(["measures", "--currencies", "EUR", "--periods", "MONTH", "--output", str(tmp_path / "out.csv"),
+                     "--diagnostics", str(output)])
+    assert code == 0
+
+    exported = json.loads(output.read_text())
+    assert exported['enabled']
+    assert exported['spans']['compute.statistical_measures']['count'] == len(AnalysisPeriod)
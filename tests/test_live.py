@@ -0,0 +1,173 @@
+from datetime import date, timedelta
+
+import pytest
+from freezegun import freeze_time
+
+from app import api, live
+from app.constans import AnalysisPeriod
+from app.data_sources import NbpHttpSource, FixtureSource
+from app.mock_server import MockNbpServer
+from app.series import JOIN_FFILL, JOIN_INNER
+
+
+def weekdays(date_start: date, date_end: date, first_mid: float, step: float) -> list[dict]:
+    rates = []
+    day = date_start
+    mid = first_mid
+    while day <= date_end:
+        if day.weekday() < 5:
+            mid = round(mid + step * (1 if day.day % 3 else -2), 4)
+            rates.append({'effectiveDate': day.isoformat(), 'mid': mid})
+        day += timedelta(days=1)
+    return rates
+
+
+@pytest.fixture
+def nbp(fake_nbp):
+    fake_nbp.rates["EUR"] = weekdays(date(2023, 1, 2), date(2024, 3, 1), 4.3, 0.01)
+    fake_nbp.rates["USD"] = weekdays(date(2023, 1, 2), date(2024, 3, 1), 4.0, 0.007)
+    return fake_nbp
+
+
+def publish(nbp, effective_date: str, mids: dict[str, float]):
+    for currency, mid in mids.items():
+        nbp.rates[currency].append({'effectiveDate': effective_date, 'mid': mid})
+
+
+def test_last_fixings(nbp, store):
+    """
+    Test case for testing that the latest table is downloaded with one request and saved in the store.
+    """
+    effective_date, fixings = live.get_last_fixings()
+    assert effective_date == date(2024, 3, 1)
+    assert set(fixings) == {"EUR", "USD"}
+    assert len(nbp.urls) == 1
+    assert nbp.urls[0].endswith("/exchangerates/tables/A/last/?format=json")
+    assert store.get_rates("A", "EUR", date(2024, 3, 1), date(2024, 3, 1))[0]['mid'] == fixings["EUR"]
+
+
+def test_live_analysis(nbp):
+    """
+    Test case for testing that analyses updated with new fixings equal analyses computed from scratch.
+    """
+    with freeze_time("2024-03-01") as frozen:
+        analysis = live.load_live_analysis("EUR")
+        assert analysis.sessions_data() == api.get_sessions_data_all_periods("EUR")
+        expected = api.get_statistical_measures_all_periods("EUR")
+        assert analysis.statistical_measures() == {period: pytest.approx(expected[period]) for period in expected}
+
+        for day, mid in (("2024-03-04", 4.2), ("2024-03-05", 4.9), ("2024-03-06", 4.9)):
+            frozen.move_to(day)
+            publish(nbp, day, {"EUR": mid})
+            assert analysis.update(date.fromisoformat(day), {"EUR": mid, "USD": 4.0})
+            assert not analysis.update(date.fromisoformat(day), {"EUR": mid})
+
+            assert analysis.sessions_data() == api.get_sessions_data_all_periods("EUR")
+            expected = api.get_statistical_measures_all_periods("EUR")
+            assert analysis.statistical_measures() == {period: pytest.approx(expected[period]) for period in expected}
+
+
+def test_live_analysis_missed_table(nbp):
+    """
+    Test case for testing that fixings following a missed table are not added to the analysis.
+    """
+    with freeze_time("2024-03-01") as frozen:
+        analysis = live.load_live_analysis("EUR")
+
+        frozen.move_to("2024-03-05")
+        publish(nbp, "2024-03-04", {"EUR": 4.2})
+        publish(nbp, "2024-03-05", {"EUR": 4.9})
+        assert not analysis.misses_tables(date(2024, 3, 4))
+        assert analysis.misses_tables(date(2024, 3, 5))
+        analysis.update(date(2024, 3, 5), {"EUR": 4.9})
+        assert analysis.last_date == date(2024, 3, 1)
+
+        reloaded = live.load_live_analysis("EUR")
+        assert not reloaded.misses_tables(date(2024, 3, 6))
+        assert reloaded.sessions_data() == api.get_sessions_data_all_periods("EUR")
+
+
+def test_pair_changes_windows(nbp):
+    """
+    Test case for testing that histograms of windows sliced from the pair changes equal histograms computed
+    from scratch.
+    """
+    del nbp.rates["USD"][10:14]  # days with only one currency
+    with freeze_time("2024-03-01"):
+        for join in (JOIN_INNER, JOIN_FFILL):
+            date_start, date_end = live.get_distribution_window(date(2023, 6, 1), AnalysisPeriod.MONTH)
+            changes = live.load_pair_changes("EUR", "USD", date_start, date_end, join)
+            assert changes.date_start == date(2022, 5, 31) and changes.date_end == date(2024, 3, 1)
+
+            for start_date in (date(2023, 1, 2), date(2023, 1, 14), date(2023, 1, 16), date(2024, 2, 10)):
+                for period in (AnalysisPeriod.MONTH, AnalysisPeriod.QUARTER):
+                    window = live.get_distribution_window(start_date, period)
+                    assert changes.covers(*window)
+                    hist, bins = changes.histogram(*window)
+                    expected_hist, expected_bins = api.get_changes_distribution("EUR", "USD", start_date, period, join)
+                    assert hist.tolist() == expected_hist.tolist()
+                    assert bins.tolist() == pytest.approx(expected_bins.tolist())
+
+            assert not changes.covers(date(2022, 5, 30), date(2022, 6, 30))
+
+
+def test_pair_changes_update(nbp):
+    """
+    Test case for testing that new fixings extend the pair changes at the end of the range.
+    """
+    with freeze_time("2024-03-01") as frozen:
+        changes = live.load_pair_changes("EUR", "USD", date(2024, 2, 1), date(2024, 3, 1))
+
+        frozen.move_to("2024-03-04")
+        publish(nbp, "2024-03-04", {"EUR": 4.2, "USD": 4.1})
+        assert changes.update(date(2024, 3, 4), {"EUR": 4.2, "USD": 4.1})
+        assert not changes.update(date(2024, 3, 4), {"EUR": 4.2, "USD": 4.1})
+        assert not changes.update(date(2024, 3, 5), {"EUR": 4.2})
+        assert changes.covers(date(2024, 2, 4), date(2024, 3, 4))
+
+        hist, bins = api.get_changes_distribution("EUR", "USD", date(2024, 2, 4), AnalysisPeriod.MONTH)
+        assert changes.histogram(date(2024, 2, 4), date(2024, 3, 4))[0].tolist() == hist.tolist()
+        previous = nbp.rates["USD"][-2]['mid'] / nbp.rates["EUR"][-2]['mid']
+        assert changes.window(date(2024, 2, 4), date(2024, 3, 4))[-1] == pytest.approx(4.1 / 4.2 - previous)
+
+
+def test_pair_changes_past_range(nbp):
+    """
+    Test case for testing that new fixings do not extend pair changes of a range ending in the past.
+    """
+    with freeze_time("2024-03-04"):
+        changes = live.load_pair_changes("EUR", "USD", date(2023, 2, 1), date(2023, 2, 28))
+        assert changes.date_end == date(2024, 2, 29)
+
+        publish(nbp, "2024-03-04", {"EUR": 4.2, "USD": 4.1})
+        assert changes.misses_tables(date(2024, 3, 4))
+        assert not changes.update(date(2024, 3, 4), {"EUR": 4.2, "USD": 4.1})
+        assert changes.date_end == date(2024, 2, 29)
+        assert not changes.covers(date(2024, 2, 5), date(2024, 3, 4))
+
+
+def test_prefetch_year(nbp):
+    """
+    Test case for testing that live analyses of prefetched currencies are loaded without downloads.
+    """
+    with freeze_time("2024-03-01"):
+        for currency in ("EUR", "USD"):
+            live.prefetch_year(currency)
+        urls_count = len(nbp.urls)
+        assert live.load_live_analysis("USD").sessions_data() == api.get_sessions_data_all_periods("USD")
+        assert len(nbp.urls) == urls_count
+
+
+@freeze_time("2024-03-01")
+def test_mock_server_last_table(store):
+    """
+    Test case for testing the latest table served by the local stand-in of the NBP API.
+    """
+    source = FixtureSource({"EUR": weekdays(date(2024, 2, 1), date(2024, 2, 29), 4.3, 0.01)})
+    server = MockNbpServer(source).start()
+    try:
+        last_table = NbpHttpSource(server.url).fetch_last_table()
+    finally:
+        server.stop()
+    assert list(last_table) == ["EUR"]
+    assert last_table["EUR"][0]['effectiveDate'] == "2024-02-29"
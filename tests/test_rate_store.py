@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+from freezegun import freeze_time
+
+from app import api
+from app.constans import AnalysisPeriod
+from app.data_sources import get_data_source
+
+
+@freeze_time("2024-05-25")
+def test_missing_ranges(store):
+    """
+    Test case for testing which ranges are reported as not downloaded yet.
+    """
+    assert store.missing_ranges("A", "EUR", date(2024, 5, 1), date(2024, 5, 10)) == [
+        (date(2024, 5, 1), date(2024, 5, 10))
+    ]
+
+    store.add_rates("A", "EUR", [{'effectiveDate': "2024-05-06", 'mid': 4.3}], date(2024, 5, 4), date(2024, 5, 6))
+    assert store.missing_ranges("A", "EUR", date(2024, 5, 1), date(2024, 5, 10)) == [
+        (date(2024, 5, 1), date(2024, 5, 3)),
+        (date(2024, 5, 7), date(2024, 5, 10))
+    ]
+    assert store.missing_ranges("A", "eur", date(2024, 5, 4), date(2024, 5, 6)) == []
+    assert store.missing_ranges("A", "USD", date(2024, 5, 4), date(2024, 5, 6)) == [
+        (date(2024, 5, 4), date(2024, 5, 6))
+    ]
+
+
+@freeze_time("2024-05-25")
+def test_today_is_never_complete(store):
+    """
+    Test case for testing that today's rate is always downloaded again.
+    """
+    store.add_rates("A", "EUR", [{'effectiveDate': "2024-05-24", 'mid': 4.3}], date(2024, 5, 20), date(2024, 5, 25))
+    assert store.missing_ranges("A", "EUR", date(2024, 5, 20), date(2024, 5, 25)) == [
+        (date(2024, 5, 25), date(2024, 5, 25))
+    ]
+    assert store.get_rates("A", "EUR", date(2024, 5, 20), date(2024, 5, 25)) == [
+        {'effectiveDate': "2024-05-24", 'mid': 4.3}
+    ]
+
+
+@freeze_time("2024-05-25")
+def test_read_through(fake_nbp):
+    """
+    Test case for testing that the API functions download every range only once.
+    """
+    fake_nbp.rates["USD"] = [
+        {'effectiveDate': "2024-05-20", 'mid': 3.92},
+        {'effectiveDate': "2024-05-21", 'mid': 3.93},
+        {'effectiveDate': "2024-05-22", 'mid': 3.91},
+    ]
+
+    assert api.get_sessions_data("USD", AnalysisPeriod.WEEK) == (1, 1, 0)
+    assert len(fake_nbp.urls) == 1
+
+    assert api.get_sessions_data("USD", AnalysisPeriod.WEEK) == (1, 1, 0)
+    assert len(fake_nbp.urls) == 1  # served from the response cache
+
+    get_data_source().cache.clear()
+    assert api.get_sessions_data("USD", AnalysisPeriod.WEEK) == (1, 1, 0)
+    assert len(fake_nbp.urls) == 2
+    assert fake_nbp.urls[-1].endswith("/USD/2024-05-25/2024-05-25/?format=json")
+
+
+def test_unknown_currency_not_stored(store, fake_nbp):
+    """
+    Test case for testing that failed requests are not remembered.
+    """
+    with pytest.raises(ValueError) as e:
+        api.get_sessions_data("ASD", AnalysisPeriod.WEEK)
+    assert str(e.value) == "Invalid request parameters"
+    assert not store.has_currency("A", "ASD")
+
+
+@freeze_time("2024-05-25")
+def test_all_periods_single_download(fake_nbp):
+    """
+    Test case for testing that all analysis periods are computed from one downloaded series.
+    """
+    fake_nbp.rates["USD"] = [
+        {'effectiveDate': "2024-01-02", 'mid': 3.95},
+        {'effectiveDate': "2024-05-20", 'mid': 3.92},
+        {'effectiveDate': "2024-05-21", 'mid': 3.93},
+        {'effectiveDate': "2024-05-22", 'mid': 3.91},
+    ]
+
+    sessions = api.get_sessions_data_all_periods("USD")
+    requests_count = len(fake_nbp.urls)
+    measures = api.get_statistical_measures_all_periods("USD")
+    assert len(fake_nbp.urls) == requests_count
+    assert list(sessions) == list(AnalysisPeriod)
+    assert sessions[AnalysisPeriod.WEEK] == (1, 1, 0)
+    assert sessions[AnalysisPeriod.YEAR] == (1, 2, 0)
+    assert measures[AnalysisPeriod.WEEK][0] == 3.92
+    assert measures[AnalysisPeriod.YEAR][0] == 3.925
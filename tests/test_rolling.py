@@ -0,0 +1,88 @@
+import math
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from freezegun import freeze_time
+
+from app import api
+from app.constans import AnalysisPeriod
+from app.engine import calculate_statistical_measures, count_sessions
+from app.rolling import RollingSessions, RollingStatistics
+
+
+def test_rolling_statistics():
+    """
+    Test case for testing sliding window measures against measures computed from scratch.
+    """
+    generator = np.random.default_rng(2024)
+    values = np.round(4 + generator.normal(0, 0.02, 400).cumsum() / 10, 3)
+
+    for window_size in (2, 5, 30):
+        window = RollingStatistics()
+        for index, value in enumerate(values):
+            window.push(float(value))
+            if len(window) > window_size:
+                window.pop()
+            if len(window) < 2:
+                continue
+
+            expected = calculate_statistical_measures(values[max(0, index + 1 - window_size):index + 1])
+            result = window.measures()
+            assert result[0] == pytest.approx(expected[0], abs=1e-12)
+            assert result[1] == expected[1]
+            assert result[2] == pytest.approx(expected[2], rel=1e-6, abs=1e-7)
+            assert result[3] == pytest.approx(expected[3], rel=1e-6, abs=1e-7)
+
+
+def test_rolling_sessions():
+    """
+    Test case for testing sliding window sessions against sessions counted from scratch.
+    """
+    values = np.round(4 + np.random.default_rng(9).integers(-1, 2, 300).cumsum() / 100, 2)
+
+    for window_size in (1, 2, 7, 40):
+        window = RollingSessions()
+        for index, value in enumerate(values):
+            window.push(float(value))
+            if len(window) > window_size:
+                window.pop()
+            assert window.sessions() == count_sessions(values[max(0, index + 1 - window_size):index + 1])
+
+
+def test_single_value_window():
+    """
+    Test case for testing measures of a window with one rate.
+    """
+    window = RollingStatistics()
+    window.push(4.2)
+    median_value, mode, standard_deviation, coefficient_of_variation = window.measures()
+    assert median_value == 4.2
+    assert mode == 4.2
+    assert math.isnan(standard_deviation)
+    assert math.isnan(coefficient_of_variation)
+
+
+@freeze_time("2024-05-25")
+def test_rolling_statistical_measures(fake_nbp):
+    """
+    Test case for testing that the last rolling measures equal the measures of the period ending today.
+    """
+    generator = np.random.default_rng(7)
+    day = date(2023, 1, 2)
+    fake_nbp.rates["USD"] = []
+    while day <= date(2024, 5, 25):
+        if day.weekday() < 5:
+            fake_nbp.rates["USD"].append({'effectiveDate': day.isoformat(), 'mid': round(4 + generator.normal(0, 0.05), 3)})
+        day += timedelta(days=1)
+    fake_nbp.rates["USD"].append({'effectiveDate': "2024-05-25", 'mid': 3.95})
+
+    rolling = api.get_rolling_statistical_measures_all_periods("USD", date(2024, 5, 1))
+    for period in AnalysisPeriod:
+        assert rolling[period][0][0] == "2024-05-01"
+        assert rolling[period][-1][0] == "2024-05-25"
+        expected = api.get_statistical_measures("USD", period)
+        assert rolling[period][-1][1:] == pytest.approx(expected, rel=1e-9)
+
+    assert api.get_rolling_statistical_measures("USD", AnalysisPeriod.MONTH, date(2024, 5, 1)) == \
+        rolling[AnalysisPeriod.MONTH]
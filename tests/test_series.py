@@ -0,0 +1,90 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.series import JOIN_FFILL, RateSeries, align, cross_rate_matrix, cross_rates
+
+RATES = [
+    {'effectiveDate': "2024-05-20", 'mid': 3.92},
+    {'effectiveDate': "2024-05-21", 'mid': 3.93},
+    {'effectiveDate': "2024-05-22", 'mid': 3.91},
+    {'effectiveDate': "2024-05-24", 'mid': 3.94},
+]
+
+
+def test_from_rates():
+    """
+    Test case for testing conversion of NBP rates to a series and back.
+    """
+    series = RateSeries.from_rates(RATES)
+    assert len(series) == 4
+    assert series.dates.dtype == np.dtype("datetime64[D]")
+    assert series.mids.dtype == np.float64
+    assert series.to_rates() == RATES
+    assert len(RateSeries.from_rates([])) == 0
+
+
+def test_slicing_by_date():
+    """
+    Test case for testing that slices by date are views of the original arrays.
+    """
+    series = RateSeries.from_rates(RATES)
+    assert series.index_of(date(2024, 5, 23)) == 3
+    assert series.between(date(2024, 5, 21), date(2024, 5, 23)).mids.tolist() == [3.93, 3.91]
+    assert series.between(date(2024, 5, 25), date(2024, 5, 30)).mids.tolist() == []
+
+    since = series.since(date(2024, 5, 21))
+    assert since.date_strings().tolist() == ["2024-05-21", "2024-05-22", "2024-05-24"]
+    assert np.shares_memory(since.mids, series.mids)
+    assert np.shares_memory(since.dates, series.dates)
+
+
+def test_inconsistent_arrays():
+    """
+    Test case for testing that dates and mid rates must have the same length.
+    """
+    with pytest.raises(ValueError):
+        RateSeries(np.array(["2024-05-20"], dtype="datetime64[D]"), np.array([3.92, 3.93]))
+    with pytest.raises(TypeError):
+        RateSeries.from_rates(RATES)[0]
+
+
+def make_series(days: list[str], mids: list[float]) -> RateSeries:
+    return RateSeries(np.array(days, dtype="datetime64[D]"), np.array(mids))
+
+
+def test_align():
+    """
+    Test case for testing inner and forward filled joins of series with different days.
+    """
+    first = make_series(["2024-01-01", "2024-01-02", "2024-01-04"], [1.0, 2.0, 4.0])
+    second = make_series(["2024-01-02", "2024-01-03", "2024-01-04"], [10.0, 30.0, 40.0])
+
+    days, mids = align([first, second])
+    assert days.astype(str).tolist() == ["2024-01-02", "2024-01-04"]
+    assert mids.tolist() == [[2.0, 4.0], [10.0, 40.0]]
+
+    days, mids = align([first, second], JOIN_FFILL)
+    assert days.astype(str).tolist() == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert mids.tolist() == [[2.0, 2.0, 4.0], [10.0, 30.0, 40.0]]
+
+    days, mids = align([first, RateSeries.from_rates([])], JOIN_FFILL)
+    assert len(days) == 0
+    with pytest.raises(ValueError):
+        align([first, second], "outer")
+
+
+def test_cross_rates():
+    """
+    Test case for testing cross rates of a pair and of N currencies.
+    """
+    first = make_series(["2024-01-01", "2024-01-02"], [2.0, 4.0])
+    second = make_series(["2024-01-01", "2024-01-02"], [10.0, 10.0])
+    third = make_series(["2024-01-02"], [1.0])
+
+    assert cross_rates(first, second).mids.tolist() == [5.0, 2.5]
+
+    days, matrix = cross_rate_matrix([first, second, third])
+    assert matrix.shape == (1, 3, 3)
+    assert matrix[0].tolist() == [[1.0, 2.5, 0.25], [0.4, 1.0, 0.1], [4.0, 10.0, 1.0]]
@@ -0,0 +1,82 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from app import http_client
+from app.data_sources import NbpHttpSource
+from app.single_flight import SingleFlight
+
+CALLERS = 4
+WAIT_TIMEOUT = 10.0
+
+
+def run_together(fn, release: threading.Event, waiting) -> list:
+    """
+    Calls fn from CALLERS threads and releases the first call once all other callers are waiting for it.
+    """
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(fn) for _ in range(CALLERS)]
+        while waiting() < CALLERS - 1:
+            if time.monotonic() > deadline:
+                release.set()
+                pytest.fail(f"{CALLERS - 1 - waiting()} callers did not wait for the call in flight")
+            time.sleep(0.01)
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_identical_calls_shared():
+    """
+    Test case for testing that identical calls in flight make one call, with its result or exception
+    given to every caller.
+    """
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch(value):
+        calls.append(value)
+        release.wait()
+        if value == "error":
+            raise ValueError("Invalid request parameters")
+        return [value]
+
+    results = run_together(lambda: flights.do("key", fetch, "data"), release, lambda: flights.shared)
+    assert results == [["data"]] * CALLERS
+    assert all(result is results[0] for result in results)
+    assert calls == ["data"]
+
+    release.clear()
+    errors = run_together(lambda: flights.do("key", fetch, "error"), release, lambda: flights.shared - 3)
+    assert all(isinstance(error, ValueError) and error.args == ("Invalid request parameters",) for error in errors)
+    assert len({id(error) for error in errors}) == CALLERS
+    assert sum(error.__cause__ is None for error in errors) == 1
+
+    assert flights.do("other", lambda: 1) == 1
+    assert flights.stats() == {'calls': 3, 'shared': 6, 'in_flight': 0, 'hit_rate': pytest.approx(6 / 9)}
+
+
+def test_nbp_requests_deduplicated(fake_nbp, monkeypatch):
+    """
+    Test case for testing that NBP urls requested at the same time by several callers are downloaded once.
+    """
+    fake_nbp.rates["EUR"] = [{'effectiveDate': "2024-05-20", 'mid': 4.3}, {'effectiveDate': "2024-05-21", 'mid': 4.31}]
+    release = threading.Event()
+
+    def slow_get(url):
+        release.wait()
+        return fake_nbp.get(url)
+
+    monkeypatch.setattr(http_client, "get", slow_get)
+    source = NbpHttpSource()
+    results = run_together(
+        lambda: source.fetch_rates([("EUR", date(2024, 5, 20), date(2024, 5, 21))]), release,
+        lambda: source.flights.shared
+    )
+    assert results == [[fake_nbp.rates["EUR"]]] * CALLERS
+    assert len(fake_nbp.urls) == 1
+    assert source.flights.stats()['shared'] == CALLERS - 1
@@ -0,0 +1,32 @@
+import pytest
+
+from tests.conftest import run_qt_script
+
+pytest.importorskip("PySide6")
+
+# time from starting the interpreter to the shown main menu, generous for slow CI machines
+STARTUP_BUDGET_SECONDS = 3.0
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from app.main import MainWindow
+app = QApplication()
+window = MainWindow()
+window.show()
+app.processEvents()
+print(json.dumps({
+    'seconds': time.perf_counter() - start,
+    'modules': sorted({name.split('.')[0] for name in sys.modules} & {'matplotlib', 'numpy', 'requests'}),
+}))
+"""
+
+
+def test_startup_time():
+    """
+    Test case for testing that the main menu is shown within the startup budget, before matplotlib, numpy
+    and requests are imported.
+    """
+    startup = run_qt_script(STARTUP_SCRIPT)
+    assert startup['modules'] == []
+    assert startup['seconds'] < STARTUP_BUDGET_SECONDS
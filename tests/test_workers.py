@@ -0,0 +1,136 @@
+import pytest
+
+from tests.conftest import run_qt_script
+
+pytest.importorskip("PySide6")
+
+RUNNER_SCRIPT = """
+import json
+import threading
+from PySide6.QtCore import QCoreApplication, QThreadPool, QTimer
+from app.workers import RequestRunner
+app = QCoreApplication()
+pool = QThreadPool()
+pool.setMaxThreadCount(1)
+runner = RequestRunner(thread_pool=pool)
+running = threading.Event()
+release = threading.Event()
+calls = []
+events = []
+
+def load(value):
+    calls.append(value)
+    if value == 1:
+        running.set()
+        release.wait(5)
+    if value < 0:
+        raise ValueError("Invalid request parameters")
+    return value
+
+def burst():
+    runner.submit(load, 1)
+    running.wait(5)
+    runner.submit(load, 2)
+    runner.submit(load, 3)
+    release.set()
+
+def finished(result):
+    events.append(result)
+    runner.submit(load, -1)
+
+def failed(message):
+    events.append(message)
+    app.quit()
+
+runner.started.connect(lambda: events.append('started'))
+runner.finished.connect(finished)
+runner.failed.connect(failed)
+QTimer.singleShot(0, burst)
+QTimer.singleShot(5000, app.quit)
+app.exec()
+pool.waitForDone()
+print(json.dumps({'calls': calls, 'events': events}))
+"""
+
+
+def test_request_runner():
+    """
+    Test case for testing that only the result of the latest request is delivered, that requests still waiting
+    in the pool are skipped, and that failures are reported.
+    """
+    assert run_qt_script(RUNNER_SCRIPT) == {
+        'calls': [1, 3, -1],
+        'events': ['started', 'started', 'started', 3, 'started', "Invalid request parameters"],
+    }
+
+
+SCHEDULER_SCRIPT = """
+import json
+from PySide6.QtCore import QCoreApplication, QTimer
+from app.workers import UpdateScheduler
+app = QCoreApplication()
+state = {'value': 0}
+updates = []
+scheduler = UpdateScheduler(lambda: updates.append(state['value']), delay_ms=50)
+
+def burst():
+    for value in range(1, 6):
+        state['value'] = value
+        scheduler.schedule(value)
+
+def flushed():
+    state['value'] = 10
+    scheduler.schedule()
+    scheduler.flush()
+    scheduler.schedule()
+    scheduler.cancel()
+
+QTimer.singleShot(0, burst)
+QTimer.singleShot(300, flushed)
+QTimer.singleShot(600, app.quit)
+app.exec()
+print(json.dumps({'updates': updates, 'pending': scheduler.is_pending()}))
+"""
+
+
+def test_update_scheduler():
+    """
+    Test case for testing that a burst of inputs makes one update with the latest state, and that pending
+    updates can be flushed or cancelled.
+    """
+    assert run_qt_script(SCHEDULER_SCRIPT) == {'updates': [5, 10], 'pending': False}
+
+
+PREFETCHER_SCRIPT = """
+import json
+from PySide6.QtCore import QCoreApplication, QTimer
+from app.workers import Prefetcher
+app = QCoreApplication()
+calls = []
+
+def fetch(currency):
+    calls.append(currency)
+    if currency == "OFFLINE":
+        raise ConnectionError("offline")
+
+results = {}
+for name, currencies in (("online", ["EUR", "USD", "GBP"]), ("offline", ["EUR", "OFFLINE", "USD", "GBP"])):
+    calls.clear()
+    prefetcher = Prefetcher(fetch, [(currency,) for currency in currencies], max_workers=1)
+    prefetcher.finished.connect(app.quit)
+    QTimer.singleShot(0, prefetcher.start)
+    QTimer.singleShot(5000, app.quit)
+    app.exec()
+    results[name] = {'calls': list(calls), 'loaded': prefetcher.loaded}
+print(json.dumps(results))
+"""
+
+
+def test_prefetcher():
+    """
+    Test case for testing that every prefetch call is made once, and that a failure stops the remaining calls.
+    """
+    assert run_qt_script(PREFETCHER_SCRIPT) == {
+        'online': {'calls': ["EUR", "USD", "GBP"], 'loaded': 3},
+        'offline': {'calls': ["EUR", "OFFLINE"], 'loaded': 1},
+    }